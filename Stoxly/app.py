@@ -9,6 +9,7 @@ from datetime import datetime
 from lib.mock_service import fetch_data
 from lib.financial_analysis import calculate_all_indicators
 from lib.text_translator import translate_indicators, get_risk_level
+from lib.symbol_index import get_symbol_index
 from lib.types import AssetType, AnalysisResult
 
 # Sayfa yapılandırması
@@ -79,6 +80,21 @@ with st.sidebar:
             help="Kripto para kodu (örn: BTC, ETH, ADA)"
         )
     
+    # Girdiyi veri çekmeden önce yerel sembol indeksinde çöz
+    symbol_index = get_symbol_index()
+    symbol_info = symbol_index.resolve(ticker, asset_type)
+    if symbol_info is not None:
+        ticker = symbol_info.symbol
+        st.caption(f"✅ {symbol_info.symbol} - {symbol_info.name}")
+    elif ticker.strip():
+        suggestions = symbol_index.search(ticker, limit=5, asset_type=asset_type)
+        if suggestions:
+            st.caption("Bunu mu demek istediniz: " + ", ".join(
+                f"{s.symbol} ({s.name})" for s in suggestions
+            ))
+        else:
+            st.caption("ℹ️ Bu kod sembol listesinde yok; doğrudan Yahoo Finance'ta aranacak.")
+    
     analyze_button = st.button("📊 Analiz Et", type="primary", use_container_width=True)
     
     st.markdown("---")
@@ -134,6 +150,12 @@ if analyze_button or 'analysis_result' in st.session_state:
         indicators = analysis_result.indicators
         insights = analysis_result.translated_insights
         
+        # Veri kaynağı uyarısı
+        if indicators.data_source == "mock":
+            st.error("⚠️ Gerçek veri çekilemedi. Aşağıdaki değerler örnek (mock) veridir, yatırım kararı için kullanmayın.")
+        elif indicators.data_source == "stale":
+            st.warning("⚠️ Veri sağlayıcısına şu an ulaşılamıyor. Son başarılı veri (güncel olmayabilir) gösteriliyor.")
+        
         # Dashboard Layout
         # Sol Panel - Uyarılar ve Aksiyonlar
         col1, col2 = st.columns([1, 2])
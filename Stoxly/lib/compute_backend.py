@@ -0,0 +1,189 @@
+"""
+Hesaplama backend'leri - Özyinelemeli (recursive) gösterge çekirdekleri
+Wilder yumuşatma ve EMA gibi özyinelemeli hesaplamalar için referans NumPy
+implementasyonu ve (kuruluysa) Numba ile JIT derlenmiş implementasyon sağlar
+"""
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba opsiyonel bir bağımlılık
+    numba = None
+
+
+logger = logging.getLogger(__name__)
+
+# Backend seçimi için ortam değişkeni: "auto", "numpy" veya "numba"
+BACKEND_ENV_VAR = "STOXLY_COMPUTE_BACKEND"
+
+
+@dataclass
+class ComputeBackend:
+    """Özyinelemeli çekirdekleri sağlayan backend"""
+    name: str
+    smooth: Callable[[np.ndarray, int, float], np.ndarray]
+
+
+def _smooth_numpy(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """
+    Referans implementasyon - zaman ekseni üzerinde döngü, semboller üzerinde vektör
+    values: (sembol sayısı, bar sayısı) boyutunda matris
+    NaN değerler (baştaki veya aradaki boşluklar: tatiller, işlem durdurmaları)
+    atlanır: o bar için NaN döner, durum bir sonraki geçerli değere taşınır.
+    İlk değer ilk `period` geçerli değerin ortalamasıdır, sonrası:
+    s[t] = s[t-1] + alpha * (x[t] - s[t-1])
+    """
+    n_symbols, n_bars = values.shape
+    out = np.full((n_symbols, n_bars), np.nan)
+    if n_bars < period:
+        return out
+
+    valid = ~np.isnan(values)
+    counts = np.cumsum(valid, axis=1)
+    seeded = counts[:, -1] >= period
+    seed_index = np.where(seeded, (counts >= period).argmax(axis=1), n_bars)
+    seeds = np.where(valid & (counts <= period), values, 0.0).sum(axis=1) / period
+
+    state = np.full(n_symbols, np.nan)
+    for t in range(period - 1, n_bars):
+        x = values[:, t]
+        state = np.where(
+            seed_index == t,
+            seeds,
+            np.where(valid[:, t], state + alpha * (x - state), state)
+        )
+        out[:, t] = np.where(valid[:, t], state, np.nan)
+
+    return out
+
+
+def _build_numba_smooth() -> Optional[Callable[[np.ndarray, int, float], np.ndarray]]:
+    """Numba kuruluysa JIT derlenmiş çekirdeği oluştur"""
+    if numba is None:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def _smooth_numba(values, period, alpha):
+        n_symbols, n_bars = values.shape
+        out = np.full((n_symbols, n_bars), np.nan)
+
+        for i in numba.prange(n_symbols):
+            count = 0
+            state = 0.0
+            for t in range(n_bars):
+                x = values[i, t]
+                if np.isnan(x):
+                    continue
+                count += 1
+                if count < period:
+                    state += x
+                elif count == period:
+                    state = (state + x) / period
+                    out[i, t] = state
+                else:
+                    state = state + alpha * (x - state)
+                    out[i, t] = state
+
+        return out
+
+    return _smooth_numba
+
+
+_BACKENDS: Dict[str, ComputeBackend] = {
+    "numpy": ComputeBackend(name="numpy", smooth=_smooth_numpy),
+}
+
+_numba_smooth = _build_numba_smooth()
+if _numba_smooth is not None:
+    _BACKENDS["numba"] = ComputeBackend(name="numba", smooth=_numba_smooth)
+
+
+def available_backends() -> list:
+    """Kullanılabilir backend isimlerini döndür"""
+    return list(_BACKENDS)
+
+
+def get_backend(name: Optional[str] = None) -> ComputeBackend:
+    """
+    Backend seç
+    İsim verilmezse STOXLY_COMPUTE_BACKEND ortam değişkeni kullanılır.
+    "auto" (varsayılan) Numba kuruluysa ve referans NumPy implementasyonuyla
+    eşdeğerliği doğrulanırsa onu, değilse NumPy'ı seçer.
+    """
+    if name is None:
+        name = os.environ.get(BACKEND_ENV_VAR, "auto")
+    name = name.lower()
+
+    if name == "auto":
+        return _auto_backend()
+
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Bilinmeyen veya kurulu olmayan backend: {name}. "
+            f"Kullanılabilir: {', '.join(available_backends())}"
+        )
+
+    return _BACKENDS[name]
+
+
+@lru_cache(maxsize=None)
+def _auto_backend() -> ComputeBackend:
+    """Numba backend'ini ilk seçimde bir kez doğrula"""
+    if "numba" not in _BACKENDS:
+        return _BACKENDS["numpy"]
+    if not verify_backends().get("numba", False):
+        logger.warning("Numba backend'i NumPy ile eşdeğer değil; NumPy kullanılıyor.")
+        return _BACKENDS["numpy"]
+    return _BACKENDS["numba"]
+
+
+def wilder_smooth(values: np.ndarray, period: int, backend: Optional[str] = None) -> np.ndarray:
+    """Wilder yumuşatma (alpha = 1 / period)"""
+    values = np.ascontiguousarray(np.atleast_2d(values), dtype=np.float64)
+    return get_backend(backend).smooth(values, period, 1.0 / period)
+
+
+def ema(values: np.ndarray, period: int, backend: Optional[str] = None) -> np.ndarray:
+    """Üstel hareketli ortalama (alpha = 2 / (period + 1)), SMA ile başlatılır"""
+    values = np.ascontiguousarray(np.atleast_2d(values), dtype=np.float64)
+    return get_backend(backend).smooth(values, period, 2.0 / (period + 1))
+
+
+def verify_backends(
+    n_symbols: int = 64,
+    n_bars: int = 500,
+    period: int = 14,
+    seed: int = 0,
+    rtol: float = 1e-9
+) -> Dict[str, bool]:
+    """
+    Referans dışındaki backend'leri NumPy implementasyonuyla karşılaştır
+    Test verisi, sonradan listelenen semboller gibi baştaki NaN'ları,
+    tatil ve işlem durdurması gibi aradaki boşlukları ve tamamen boş
+    satırları da içerir.
+    Her backend için eşdeğer olup olmadığını döndürür
+    """
+    rng = np.random.default_rng(seed)
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.02, (n_symbols, n_bars)), axis=1)
+    for i, start in enumerate(rng.integers(0, n_bars, n_symbols // 4)):
+        values[i, :start] = np.nan
+    values[rng.random((n_symbols, n_bars)) < 0.05] = np.nan
+    values[-1, :] = np.nan
+
+    results = {}
+    for name in available_backends():
+        if name == "numpy":
+            continue
+        matches = True
+        for alpha in (1.0 / period, 2.0 / (period + 1)):
+            expected = _smooth_numpy(values, period, alpha)
+            actual = _BACKENDS[name].smooth(values, period, alpha)
+            matches = matches and np.allclose(actual, expected, rtol=rtol, equal_nan=True)
+        results[name] = bool(matches)
+
+    return results
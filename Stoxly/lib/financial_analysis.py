@@ -1,10 +1,29 @@
 """
 Finansal analiz modülü - Teknik göstergelerin hesaplanması
 """
+import math
 import numpy as np
 import pandas as pd
-from typing import List
-from lib.types import PriceData, TechnicalIndicators
+from typing import List, Optional
+from lib.types import PriceData, TechnicalIndicators, DataSource
+from lib.compute_backend import wilder_smooth, ema
+
+
+def round_half_up(value: float, digits: int = 0) -> float:
+    """
+    lib/financial-analysis.ts ile aynı yuvarlama: Math.round(value * 10^digits) / 10^digits
+    Python'un round() fonksiyonu yarımları çifte yuvarladığından (10.125 -> 10.12)
+    iki taraf tam yarım değerlerde farklı sonuç verirdi.
+    NaN ve sonsuz değerler Math.round gibi olduğu gibi döner
+    """
+    if not math.isfinite(value):
+        return value
+    scale = 10 ** digits
+    scaled = value * scale
+    rounded = math.floor(scaled)
+    if scaled - rounded >= 0.5:
+        rounded += 1
+    return rounded / scale if digits else int(rounded)
 
 
 def calculate_rsi(prices: List[PriceData], period: int = 14) -> float:
@@ -37,7 +56,7 @@ def calculate_rsi(prices: List[PriceData], period: int = 14) -> float:
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
     
-    return round(rsi, 2)
+    return round_half_up(rsi, 2)
 
 
 def calculate_sma(prices: List[PriceData], period: int) -> float:
@@ -50,7 +69,7 @@ def calculate_sma(prices: List[PriceData], period: int) -> float:
     recent_prices = prices[-period:]
     sma = sum(p.close for p in recent_prices) / period
     
-    return round(sma, 2)
+    return round_half_up(sma, 2)
 
 
 def calculate_volatility(prices: List[PriceData], period: int = 20) -> float:
@@ -69,7 +88,7 @@ def calculate_volatility(prices: List[PriceData], period: int = 20) -> float:
     std_dev = np.sqrt(variance)
     volatility = (std_dev / mean) * 100  # Yüzde olarak
     
-    return round(volatility, 2)
+    return round_half_up(volatility, 2)
 
 
 def calculate_risk_score(prices: List[PriceData], volatility: float) -> float:
@@ -82,7 +101,7 @@ def calculate_risk_score(prices: List[PriceData], volatility: float) -> float:
     
     # Son 20 günlük fiyat değişimine göre risk (0-30 puan)
     if len(prices) < 20:
-        return round(volatility_risk)
+        return round_half_up(volatility_risk)
     
     recent_20 = prices[-20:]
     price_change = ((recent_20[-1].close - recent_20[0].close) / recent_20[0].close) * 100
@@ -91,7 +110,20 @@ def calculate_risk_score(prices: List[PriceData], volatility: float) -> float:
     additional_risk = min(volatility_risk_2, 30)
     
     total_risk = volatility_risk + additional_risk
-    return min(round(total_risk), 100)
+    return min(round_half_up(total_risk), 100)
+
+
+def get_data_source(prices: List[PriceData]) -> DataSource:
+    """
+    Fiyat verisinin kaynağını belirle
+    Herhangi bir bar mock ise "mock", bayat ise "stale" döner
+    """
+    sources = {p.source for p in prices}
+    if "mock" in sources:
+        return "mock"
+    if "stale" in sources:
+        return "stale"
+    return "live"
 
 
 def calculate_all_indicators(prices: List[PriceData]) -> TechnicalIndicators:
@@ -113,6 +145,87 @@ def calculate_all_indicators(prices: List[PriceData]) -> TechnicalIndicators:
         sma200=sma200,
         risk_score=risk_score,
         volatility=volatility,
-        current_price=current_price
+        current_price=current_price,
+        data_source=get_data_source(prices)
     )
 
+
+
+def calculate_sma_series(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    SMA serisi - her bar için calculate_sma ile aynı değer (yuvarlamasız)
+    Yeterli veri olmayan barlar için NaN döner
+    """
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return out
+    cumsum = np.cumsum(np.insert(closes, 0, 0.0))
+    out[period - 1:] = (cumsum[period:] - cumsum[:-period]) / period
+    return out
+
+
+def calculate_rsi_series(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI serisi - her bar için calculate_rsi ile aynı tanım (son `period`
+    değişimin basit ortalaması, yuvarlamasız)
+    """
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period + 1:
+        return out
+    changes = np.diff(closes)
+    avg_gain = calculate_sma_series(np.where(changes > 0, changes, 0.0), period)
+    avg_loss = calculate_sma_series(np.where(changes < 0, -changes, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    out[1:] = np.where(np.isnan(avg_gain), np.nan, rsi)
+    return out
+
+
+def calculate_rsi_matrix(
+    closes: np.ndarray,
+    period: int = 14,
+    backend: Optional[str] = None
+) -> np.ndarray:
+    """
+    Wilder yumuşatmalı RSI serisi - çoklu sembol için
+    closes: (sembol sayısı, bar sayısı) boyutunda kapanış matrisi
+
+    Not: calculate_rsi son `period` değişimin basit ortalamasını kullanır;
+    bu fonksiyon ise tüm geçmişi Wilder yöntemiyle yumuşatır. Bu nedenle
+    aynı seri için iki fonksiyonun son değerleri farklıdır.
+
+    Her satır ilk geçerli kapanıştan başlar; baştaki NaN'lar (sonradan
+    listelenen semboller) atlanır. Her satırda ilk `period` değişim için NaN döner.
+    Aradaki boş barlar (tatil, işlem durdurma) o bar ve sonraki bar için NaN
+    verir; yumuşatma durumu korunur ve sonraki geçerli değişimle devam eder.
+    """
+    closes = np.atleast_2d(np.asarray(closes, dtype=np.float64))
+    changes = np.diff(closes, axis=1)
+    missing = np.isnan(changes)
+    gains = np.where(missing, np.nan, np.where(changes > 0, changes, 0.0))
+    losses = np.where(missing, np.nan, np.where(changes < 0, -changes, 0.0))
+
+    avg_gain = wilder_smooth(gains, period, backend)
+    avg_loss = wilder_smooth(losses, period, backend)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    rsi = np.where(np.isnan(avg_gain), np.nan, rsi)
+
+    # İlk bar için değişim olmadığından başa NaN sütunu ekle
+    padding = np.full((closes.shape[0], 1), np.nan)
+    return np.hstack([padding, rsi])
+
+
+def calculate_ema_matrix(
+    closes: np.ndarray,
+    period: int,
+    backend: Optional[str] = None
+) -> np.ndarray:
+    """
+    Exponential Moving Average (EMA) serisi - çoklu sembol için
+    closes: (sembol sayısı, bar sayısı) boyutunda kapanış matrisi
+    """
+    return ema(closes, period, backend)
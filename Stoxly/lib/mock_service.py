@@ -2,11 +2,262 @@
 Mock Data Service - Veri çekme servisi
 Yahoo Finance API'sini kullanarak veya mock veri üretir
 """
+import logging
+import random
+import threading
+import time
+import zlib
 import yfinance as yf
 import pandas as pd
+from yfinance.exceptions import YFTickerMissingError
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from lib.types import PriceData, AssetType
+from lib.symbol_index import get_symbol_index
+
+
+logger = logging.getLogger(__name__)
+
+# Bilinmeyen sembollerin tekrar denenmeden önce bekleme süresi (saniye)
+NEGATIVE_CACHE_TTL = 900.0
+# Sembol listesinde olmayan bir sembolün bilinmeyen sayılması için gereken boş yanıt sayısı
+NEGATIVE_CACHE_MISSES = 2
+# Negatif önbellekte tutulacak maksimum sembol sayısı
+NEGATIVE_CACHE_SIZE = 1024
+# Yedek olarak üretilen mock verinin saklanacağı maksimum sembol sayısı
+MOCK_CACHE_SIZE = 256
+# Son başarılı verinin bayat (stale) olarak saklanacağı maksimum sembol sayısı
+LAST_GOOD_CACHE_SIZE = 256
+
+# Sembolden `history()` metoduna sahip nesne üreten fabrika
+# Yük testi gibi çevrimdışı senaryolarda değiştirilebilir
+ticker_factory: Callable[[str], Any] = yf.Ticker
+
+# yfinance hataları varsayılan olarak gizleyip boş tablo döndürür; bilinmeyen
+# sembol ile kesintiyi ayırt etmek için hatalar açılır. 1.x'te `raise_errors`
+# parametresi kullanımdan kalktığından yapılandırma üzerinden ayarlanır
+if hasattr(yf, "config"):
+    yf.config.debug.hide_exceptions = False
+    _HISTORY_KWARGS: Dict[str, Any] = {}
+else:
+    _HISTORY_KWARGS = {"raise_errors": True}
+
+
+class CircuitBreaker:
+    """
+    Upstream sağlayıcı için devre kesici
+    Art arda `failure_threshold` hata sonrası devre açılır ve
+    `reset_timeout` saniye boyunca istekler hiç denenmeden reddedilir.
+    Süre dolunca tek bir deneme isteğine izin verilir (half-open).
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Devre açık mı (istekler reddediliyor mu)"""
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        """İstek upstream'e gönderilebilir mi"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_progress:
+                return False
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Başarılı isteği kaydet ve devreyi kapat"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Başarısız isteği kaydet, eşik aşılırsa devreyi aç"""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_progress = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+# Sağlayıcı bazında devre kesiciler
+CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] = {
+    "yahoo": CircuitBreaker("yahoo"),
+}
+
+# Sembol -> (son boş yanıttan itibaren bitiş zamanı, art arda boş yanıt sayısı)
+# Ekleme sırası bitiş zamanı sırasıdır; süresi dolanlar baştan temizlenir
+_negative_cache: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+# Sembol -> sembol için üretilen deterministik mock veri
+_mock_cache: "OrderedDict[str, List[PriceData]]" = OrderedDict()
+# (sembol, period) -> son başarılı veri
+_last_good: "OrderedDict[Tuple[str, str], List[PriceData]]" = OrderedDict()
+# (sembol, period) -> son başarılı verinin "stale" işaretli kopyası (ilk kullanımda üretilir)
+_stale_copies: Dict[Tuple[str, str], List[PriceData]] = {}
+_cache_lock = threading.Lock()
+
+
+def _is_negative(symbol: str) -> bool:
+    """Sembol negatif önbellekte (bilinmeyen olarak işaretli) mi"""
+    with _cache_lock:
+        entry = _negative_cache.get(symbol)
+        if entry is None:
+            return False
+        if time.monotonic() >= entry[0]:
+            del _negative_cache[symbol]
+            return False
+        return entry[1] >= NEGATIVE_CACHE_MISSES
+
+
+def _record_miss(symbol: str) -> None:
+    """
+    Sembol için boş yanıtı kaydet
+    NEGATIVE_CACHE_MISSES kez art arda boş yanıt alan sembol bilinmeyen sayılır.
+    Süresi dolan kayıtlar eklemede temizlenir, önbellek NEGATIVE_CACHE_SIZE ile sınırlıdır
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _negative_cache.pop(symbol, None)
+        misses = entry[1] + 1 if entry is not None and now < entry[0] else 1
+        while _negative_cache and next(iter(_negative_cache.values()))[0] <= now:
+            _negative_cache.popitem(last=False)
+        _negative_cache[symbol] = (now + NEGATIVE_CACHE_TTL, misses)
+        while len(_negative_cache) > NEGATIVE_CACHE_SIZE:
+            _negative_cache.popitem(last=False)
+
+
+def _mock_data(ticker: str, symbol: str, is_crypto: bool) -> List[PriceData]:
+    """
+    Sembol için yedek mock veri
+    Sembolden türetilen tohumla üretilir ve saklanır; tekrarlanan
+    isteklerde yeniden üretilmez ve değerler değişmez
+    """
+    with _cache_lock:
+        if symbol in _mock_cache:
+            _mock_cache.move_to_end(symbol)
+            return _mock_cache[symbol]
+
+    mock_data = generate_mock_data(
+        ticker, is_crypto=is_crypto, seed=zlib.crc32(symbol.encode("utf-8"))
+    )
+
+    with _cache_lock:
+        mock_data = _mock_cache.setdefault(symbol, mock_data)
+        while len(_mock_cache) > MOCK_CACHE_SIZE:
+            _mock_cache.popitem(last=False)
+    return mock_data
+
+
+def _store_last_good(symbol: str, period: str, prices: List[PriceData]) -> None:
+    """Son başarılı veriyi sakla"""
+    with _cache_lock:
+        _last_good[(symbol, period)] = prices
+        _last_good.move_to_end((symbol, period))
+        _stale_copies.pop((symbol, period), None)
+        while len(_last_good) > LAST_GOOD_CACHE_SIZE:
+            evicted, _ = _last_good.popitem(last=False)
+            _stale_copies.pop(evicted, None)
+
+
+def _fallback(symbol: str, period: str, ticker: str, is_crypto: bool) -> List[PriceData]:
+    """
+    Veri çekilemediğinde son başarılı veriyi bayat olarak,
+    o da yoksa mock veri döndür
+    """
+    key = (symbol, period)
+    with _cache_lock:
+        if key in _stale_copies:
+            return _stale_copies[key]
+        prices = _last_good.get(key)
+        if prices is not None:
+            _stale_copies[key] = [replace(p, source="stale") for p in prices]
+            return _stale_copies[key]
+    return _mock_data(ticker, symbol, is_crypto)
+
+
+def clear_caches() -> None:
+    """Negatif önbelleği, mock ve bayat veriyi ve devre kesicileri sıfırla"""
+    with _cache_lock:
+        _negative_cache.clear()
+        _mock_cache.clear()
+        _last_good.clear()
+        _stale_copies.clear()
+    for breaker in CIRCUIT_BREAKERS.values():
+        breaker.record_success()
+
+
+def _fetch_yahoo(
+    ticker: str,
+    symbol: str,
+    period: str,
+    is_crypto: bool,
+    listed: bool
+) -> List[PriceData]:
+    """
+    Yahoo Finance'dan veri çek
+    Boş yanıt tek başına sembolün bilinmediğini kanıtlamaz (geçici boş yanıtlar
+    da YFPricesMissingError olarak gelir). Bu yüzden sembol listesindeki
+    (listed) semboller negatif önbelleğe hiç alınmaz; diğerleri art arda
+    NEGATIVE_CACHE_MISSES boş yanıttan sonra alınır. Upstream hataları
+    devre kesiciye bildirilir. Sonuç kaynağı ("stale" veya "mock")
+    PriceData üzerinde işaretlenir.
+    """
+    if _is_negative(symbol):
+        return _mock_data(ticker, symbol, is_crypto)
+
+    breaker = CIRCUIT_BREAKERS["yahoo"]
+    if not breaker.allow_request():
+        return _fallback(symbol, period, ticker, is_crypto)
+
+    try:
+        hist = ticker_factory(symbol).history(period=period, **_HISTORY_KWARGS)
+    except YFTickerMissingError:
+        # Sağlayıcı yanıt verdi ama veri yok
+        hist = pd.DataFrame()
+    except Exception as e:
+        breaker.record_failure()
+        logger.warning("Veri çekme hatası (%s): %s. Yedek veri kullanılıyor.", symbol, e)
+        return _fallback(symbol, period, ticker, is_crypto)
+
+    breaker.record_success()
+
+    if hist.empty:
+        logger.warning("Veri bulunamadı: %s. Yedek veri kullanılıyor.", symbol)
+        if not listed:
+            _record_miss(symbol)
+        return _fallback(symbol, period, ticker, is_crypto)
+
+    price_data_list = []
+    for date, row in hist.iterrows():
+        price_data_list.append(PriceData(
+            date=date.to_pydatetime(),
+            open=float(row['Open']),
+            high=float(row['High']),
+            low=float(row['Low']),
+            close=float(row['Close']),
+            volume=float(row['Volume'])
+        ))
+
+    with _cache_lock:
+        _negative_cache.pop(symbol, None)
+    _store_last_good(symbol, period, price_data_list)
+    return price_data_list
 
 
 def fetch_stock_data(ticker: str, period: str = "1y") -> List[PriceData]:
@@ -14,86 +265,51 @@ def fetch_stock_data(ticker: str, period: str = "1y") -> List[PriceData]:
     Yahoo Finance'dan hisse senedi verisi çek
     Borsa İstanbul için ticker formatı: GARAN.IS, AKBNK.IS vb.
     """
-    try:
-        # Borsa İstanbul için .IS ekle
-        if not ticker.endswith('.IS') and not '.' in ticker:
-            # Eğer crypto değilse Borsa İstanbul olarak dene
-            ticker_with_suffix = f"{ticker}.IS"
-        else:
-            ticker_with_suffix = ticker
-        
-        stock = yf.Ticker(ticker_with_suffix)
-        hist = stock.history(period=period)
-        
-        if hist.empty:
-            # Eğer veri bulunamazsa mock veri döndür
-            return generate_mock_data(ticker)
-        
-        price_data_list = []
-        for date, row in hist.iterrows():
-            price_data_list.append(PriceData(
-                date=date.to_pydatetime(),
-                open=float(row['Open']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                close=float(row['Close']),
-                volume=float(row['Volume'])
-            ))
-        
-        return price_data_list
+    info = get_symbol_index().resolve(ticker, "stock")
+    if info is not None:
+        ticker_with_suffix = info.yahoo_symbol
+    # Borsa İstanbul için .IS ekle
+    elif not ticker.endswith('.IS') and not '.' in ticker:
+        # Eğer crypto değilse Borsa İstanbul olarak dene
+        ticker_with_suffix = f"{ticker}.IS"
+    else:
+        ticker_with_suffix = ticker
     
-    except Exception as e:
-        print(f"Veri çekme hatası: {e}. Mock veri kullanılıyor.")
-        return generate_mock_data(ticker)
+    return _fetch_yahoo(ticker, ticker_with_suffix, period, is_crypto=False, listed=info is not None)
 
 
 def fetch_crypto_data(ticker: str, period: str = "1y") -> List[PriceData]:
     """
     Kripto para verisi çek
     """
-    try:
-        # Crypto için ticker formatı: BTC-USD, ETH-USD vb.
-        if not '-' in ticker:
-            ticker_with_suffix = f"{ticker}-USD"
-        else:
-            ticker_with_suffix = ticker
-        
-        crypto = yf.Ticker(ticker_with_suffix)
-        hist = crypto.history(period=period)
-        
-        if hist.empty:
-            return generate_mock_data(ticker, is_crypto=True)
-        
-        price_data_list = []
-        for date, row in hist.iterrows():
-            price_data_list.append(PriceData(
-                date=date.to_pydatetime(),
-                open=float(row['Open']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                close=float(row['Close']),
-                volume=float(row['Volume'])
-            ))
-        
-        return price_data_list
+    info = get_symbol_index().resolve(ticker, "crypto")
+    if info is not None:
+        ticker_with_suffix = info.yahoo_symbol
+    # Crypto için ticker formatı: BTC-USD, ETH-USD vb.
+    elif not '-' in ticker:
+        ticker_with_suffix = f"{ticker}-USD"
+    else:
+        ticker_with_suffix = ticker
     
-    except Exception as e:
-        print(f"Veri çekme hatası: {e}. Mock veri kullanılıyor.")
-        return generate_mock_data(ticker, is_crypto=True)
+    return _fetch_yahoo(ticker, ticker_with_suffix, period, is_crypto=True, listed=info is not None)
 
 
-def generate_mock_data(ticker: str, is_crypto: bool = False) -> List[PriceData]:
+def generate_mock_data(
+    ticker: str,
+    is_crypto: bool = False,
+    seed: Optional[int] = None
+) -> List[PriceData]:
     """
     Mock veri üret (test ve demo amaçlı)
+    seed verilirse aynı seri üretilir
     """
-    import random
-    import numpy as np
+    rng = random.Random(seed)
     
     # Başlangıç fiyatı
     if is_crypto:
-        base_price = random.uniform(20000, 60000)  # Crypto için
+        base_price = rng.uniform(20000, 60000)  # Crypto için
     else:
-        base_price = random.uniform(10, 200)  # Hisse için
+        base_price = rng.uniform(10, 200)  # Hisse için
     
     price_data_list = []
     current_price = base_price
@@ -107,17 +323,17 @@ def generate_mock_data(ticker: str, is_crypto: bool = False) -> List[PriceData]:
             continue
         
         # Random walk ile fiyat hareketi
-        change_percent = random.uniform(-0.05, 0.05)
+        change_percent = rng.uniform(-0.05, 0.05)
         current_price = current_price * (1 + change_percent)
         
         # OHLC verileri
-        daily_volatility = random.uniform(0.01, 0.03)
+        daily_volatility = rng.uniform(0.01, 0.03)
         open_price = current_price
-        high_price = open_price * (1 + random.uniform(0, daily_volatility))
-        low_price = open_price * (1 - random.uniform(0, daily_volatility))
-        close_price = open_price * (1 + random.uniform(-daily_volatility, daily_volatility))
+        high_price = open_price * (1 + rng.uniform(0, daily_volatility))
+        low_price = open_price * (1 - rng.uniform(0, daily_volatility))
+        close_price = open_price * (1 + rng.uniform(-daily_volatility, daily_volatility))
         
-        volume = random.uniform(1000000, 10000000)
+        volume = rng.uniform(1000000, 10000000)
         
         price_data_list.append(PriceData(
             date=date,
@@ -125,7 +341,8 @@ def generate_mock_data(ticker: str, is_crypto: bool = False) -> List[PriceData]:
             high=round(high_price, 2),
             low=round(low_price, 2),
             close=round(close_price, 2),
-            volume=round(volume, 0)
+            volume=round(volume, 0),
+            source="mock"
         ))
     
     return price_data_list
@@ -0,0 +1,52 @@
+import goldenVectors from "../fixtures/golden_vectors.json";
+import { calculateAllIndicators } from "./financial-analysis";
+import { getMessageIds } from "./text-translator";
+import { MessageIds, PriceData, TechnicalIndicators } from "./types";
+
+interface GoldenVectorCase {
+  name: string;
+  closes: number[];
+  indicators: TechnicalIndicators;
+  messageIds: Record<keyof MessageIds, string | null>;
+}
+
+/**
+ * TypeScript hesaplamalarını golden vector fixture'ı ile karşılaştır
+ * Aynı fixture lib/snapshot.py (verify_golden_vectors) tarafından Python için kullanılır.
+ * Uyuşmazlıkların listesini döndürür (boşsa parite sağlanmış demektir)
+ */
+export function verifyGoldenVectors(
+  cases: GoldenVectorCase[] = goldenVectors.cases as GoldenVectorCase[]
+): string[] {
+  const mismatches: string[] = [];
+
+  for (const testCase of cases) {
+    const prices: PriceData[] = testCase.closes.map((close) => ({
+      date: "2024-01-01",
+      open: close,
+      high: close,
+      low: close,
+      close,
+      volume: 0,
+    }));
+    const indicators = calculateAllIndicators(prices);
+    const messageIds = getMessageIds(indicators);
+
+    for (const key of Object.keys(testCase.indicators) as (keyof TechnicalIndicators)[]) {
+      if (indicators[key] !== testCase.indicators[key]) {
+        mismatches.push(
+          `${testCase.name}.${key}: ${indicators[key]} !== ${testCase.indicators[key]}`
+        );
+      }
+    }
+    for (const key of Object.keys(testCase.messageIds) as (keyof MessageIds)[]) {
+      if ((messageIds[key] ?? null) !== testCase.messageIds[key]) {
+        mismatches.push(
+          `${testCase.name}.${key}: ${messageIds[key]} !== ${testCase.messageIds[key]}`
+        );
+      }
+    }
+  }
+
+  return mismatches;
+}
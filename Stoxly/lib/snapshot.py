@@ -0,0 +1,305 @@
+"""
+Snapshot modülü - Front end için önceden hesaplanmış analiz snapshot'ları
+Gösterge serilerini, güncel göstergeleri ve mesaj kimliklerini
+kompakt, sütun bazlı bir binary formatta yayınlar
+
+Dosya formatı (little-endian):
+    4 byte   : b"STXS"
+    4 byte   : uint32 header uzunluğu (H)
+    H byte   : UTF-8 JSON header (8 byte hizalaması için boşlukla doldurulur)
+    ...      : header'daki sıraya göre sütunlar (date float64, diğerleri float32)
+"""
+import hashlib
+import json
+import math
+import os
+import struct
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from lib.types import PriceData, TechnicalIndicators, AssetType, IndicatorSnapshot
+from lib.financial_analysis import (
+    calculate_all_indicators,
+    calculate_rsi_series,
+    calculate_sma_series,
+    get_data_source,
+)
+from lib.text_translator import get_message_ids
+from lib.mock_service import fetch_data
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MAGIC = b"STXS"
+MANIFEST_FILE = "manifest.json"
+
+# Sütun adı -> dtype (date epoch milisaniye olarak float64, JS'te kayıpsız)
+SERIES_COLUMNS: List[Tuple[str, str]] = [
+    ("date", "<f8"),
+    ("close", "<f4"),
+    ("sma20", "<f4"),
+    ("sma50", "<f4"),
+    ("sma200", "<f4"),
+    ("rsi", "<f4"),
+]
+
+GOLDEN_VECTORS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "fixtures",
+    "golden_vectors.json"
+)
+
+# Python alan adları -> front end (lib/types.ts) alan adları
+_INDICATOR_KEYS = {
+    "rsi": "rsi",
+    "sma20": "sma20",
+    "sma50": "sma50",
+    "sma200": "sma200",
+    "risk_score": "riskScore",
+    "volatility": "volatility",
+    "current_price": "currentPrice",
+    "data_source": "dataSource",
+}
+_MESSAGE_ID_KEYS = {
+    "rsi": "rsi",
+    "risk": "risk",
+    "trend": "trend",
+    "main_warning": "mainWarning",
+    "main_action": "mainAction",
+}
+
+
+def _finite_or_none(value):
+    """
+    JSON'da NaN/Infinity geçerli olmadığından (JSON.parse hata verir)
+    sonlu olmayan sayıları null olarak yaz
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def build_snapshot(
+    ticker: str,
+    asset_type: AssetType,
+    prices: List[PriceData]
+) -> IndicatorSnapshot:
+    """Fiyat verisinden sembol snapshot'ı oluştur"""
+    closes = np.array([p.close for p in prices], dtype=np.float64)
+    dates = np.array([p.date.timestamp() * 1000 for p in prices], dtype=np.float64)
+    indicators = calculate_all_indicators(prices)
+
+    series = {
+        "date": dates,
+        "close": closes,
+        "sma20": calculate_sma_series(closes, 20),
+        "sma50": calculate_sma_series(closes, 50),
+        "sma200": calculate_sma_series(closes, 200),
+        "rsi": calculate_rsi_series(closes),
+    }
+
+    return IndicatorSnapshot(
+        ticker=ticker,
+        asset_type=asset_type,
+        indicators=indicators,
+        message_ids=get_message_ids(indicators),
+        series=series
+    )
+
+
+def encode_snapshot(snapshot: IndicatorSnapshot) -> bytes:
+    """Snapshot'ı binary formata çevir"""
+    n_bars = len(snapshot.series["date"])
+    header = {
+        "formatVersion": SNAPSHOT_FORMAT_VERSION,
+        "ticker": snapshot.ticker,
+        "assetType": snapshot.asset_type,
+        "nBars": n_bars,
+        "columns": [{"name": name, "dtype": dtype} for name, dtype in SERIES_COLUMNS],
+        "indicators": {
+            _INDICATOR_KEYS[key]: _finite_or_none(value)
+            for key, value in asdict(snapshot.indicators).items()
+        },
+        "messageIds": {
+            _MESSAGE_ID_KEYS[key]: value for key, value in snapshot.message_ids.items()
+        },
+    }
+    header_bytes = json.dumps(
+        header, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+    # Sütunların typed array olarak okunabilmesi için 8 byte hizalama
+    header_bytes += b" " * (-(len(SNAPSHOT_MAGIC) + 4 + len(header_bytes)) % 8)
+
+    parts = [SNAPSHOT_MAGIC, struct.pack("<I", len(header_bytes)), header_bytes]
+    for name, dtype in SERIES_COLUMNS:
+        parts.append(np.asarray(snapshot.series[name], dtype=dtype).tobytes())
+
+    return b"".join(parts)
+
+
+def decode_snapshot(data: bytes) -> IndicatorSnapshot:
+    """Binary formattaki snapshot'ı oku"""
+    if data[:4] != SNAPSHOT_MAGIC:
+        raise ValueError("Geçersiz snapshot dosyası")
+
+    (header_length,) = struct.unpack_from("<I", data, 4)
+    offset = 8 + header_length
+    header = json.loads(data[8:offset].decode("utf-8"))
+    if header["formatVersion"] != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen snapshot sürümü: {header['formatVersion']}")
+
+    n_bars = header["nBars"]
+    series = {}
+    for column in header["columns"]:
+        dtype = np.dtype(column["dtype"])
+        series[column["name"]] = np.frombuffer(data, dtype=dtype, count=n_bars, offset=offset)
+        offset += n_bars * dtype.itemsize
+
+    indicator_keys = {value: key for key, value in _INDICATOR_KEYS.items()}
+    # Header'da null olarak yazılan sayısal göstergeler NaN olarak geri okunur
+    indicators = {
+        indicator_keys[key]: math.nan if value is None and key != "dataSource" else value
+        for key, value in header["indicators"].items()
+    }
+    message_id_keys = {value: key for key, value in _MESSAGE_ID_KEYS.items()}
+
+    return IndicatorSnapshot(
+        ticker=header["ticker"],
+        asset_type=header["assetType"],
+        indicators=TechnicalIndicators(**indicators),
+        message_ids={message_id_keys[key]: value for key, value in header["messageIds"].items()},
+        series=series
+    )
+
+
+def snapshot_etag(data: bytes) -> str:
+    """Snapshot içeriğinden ETag üret"""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def load_manifest(output_dir: str) -> Optional[dict]:
+    """Mevcut manifest'i oku (yoksa None)"""
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def publish_snapshots(
+    universe: Iterable[Tuple[str, AssetType]],
+    output_dir: str,
+    period: str = "1y"
+) -> dict:
+    """
+    Evrendeki tüm semboller için snapshot yayınla
+    Her sembol ayrı dosyaya yazılır; manifest sembol bazında ETag tutar.
+    İstemci manifest'i çekip yalnızca ETag'i değişen sembolleri indirir.
+    İçeriği değişmeyen dosyalar yeniden yazılmaz, evrenden çıkan
+    sembollerin dosyaları silinir.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir) or {}
+    previous_symbols = previous.get("symbols", {})
+
+    symbols = {}
+    for ticker, asset_type in universe:
+        prices = fetch_data(ticker, asset_type, period)
+        if not prices:
+            continue
+
+        # Mock veri yayınlanmaz; varsa önceki snapshot korunur
+        if get_data_source(prices) == "mock":
+            if ticker in previous_symbols:
+                symbols[ticker] = previous_symbols[ticker]
+            continue
+
+        data = encode_snapshot(build_snapshot(ticker, asset_type, prices))
+        etag = snapshot_etag(data)
+        file_name = f"{ticker}.stxs"
+
+        if previous_symbols.get(ticker, {}).get("etag") != etag:
+            with open(os.path.join(output_dir, file_name), "wb") as f:
+                f.write(data)
+
+        symbols[ticker] = {"etag": etag, "file": file_name, "assetType": asset_type}
+
+    # Manifest'ten çıkan sembollerin dosyaları silinir
+    current_files = {entry["file"] for entry in symbols.values()}
+    for ticker, entry in previous_symbols.items():
+        if ticker not in symbols and entry["file"] not in current_files:
+            path = os.path.join(output_dir, entry["file"])
+            if os.path.exists(path):
+                os.remove(path)
+
+    version = hashlib.sha256(
+        "".join(f"{t}:{s['etag']};" for t, s in sorted(symbols.items())).encode("utf-8")
+    ).hexdigest()[:32]
+
+    if version == previous.get("version"):
+        return previous
+
+    manifest = {
+        "formatVersion": SNAPSHOT_FORMAT_VERSION,
+        "version": version,
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "symbols": symbols,
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest
+
+
+def golden_vector_case(name: str, closes: List[float]) -> dict:
+    """
+    Kapanış serisinden golden vector vakası oluştur
+    Alan adları front end (lib/types.ts) isimlendirmesini kullanır.
+    Veri kaynağı hesaplanan bir değer olmadığından vakaya dahil edilmez
+    """
+    prices = [
+        PriceData(
+            date=datetime(2024, 1, 1),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=0.0
+        )
+        for close in closes
+    ]
+    indicators = calculate_all_indicators(prices)
+
+    return {
+        "name": name,
+        "closes": list(closes),
+        "indicators": {
+            _INDICATOR_KEYS[key]: value
+            for key, value in asdict(indicators).items()
+            if key != "data_source"
+        },
+        "messageIds": {
+            _MESSAGE_ID_KEYS[key]: value for key, value in get_message_ids(indicators).items()
+        },
+    }
+
+
+def verify_golden_vectors(path: str = GOLDEN_VECTORS_PATH) -> List[str]:
+    """
+    Python hesaplamalarını golden vector fixture'ı ile karşılaştır
+    Aynı fixture lib/parity.ts tarafından TypeScript için kullanılır.
+    Uyuşmazlıkların listesini döndürür (boşsa parite sağlanmış demektir)
+    """
+    with open(path, encoding="utf-8") as f:
+        fixture = json.load(f)
+
+    mismatches = []
+    for case in fixture["cases"]:
+        actual = golden_vector_case(case["name"], case["closes"])
+        for section in ("indicators", "messageIds"):
+            for key, expected in case[section].items():
+                value = actual[section][key]
+                if value != expected:
+                    mismatches.append(f"{case['name']}.{key}: {value} != {expected}")
+
+    return mismatches
@@ -0,0 +1,131 @@
+import { IndicatorSnapshot, SnapshotManifest } from "./types";
+
+/**
+ * lib/snapshot.py tarafından yayınlanan snapshot'ları okur
+ * Format: "STXS" + uint32 header uzunluğu + JSON header + sütunlar
+ */
+export const SNAPSHOT_FORMAT_VERSION = 1;
+
+const SNAPSHOT_MAGIC = "STXS";
+
+interface SnapshotHeader {
+  formatVersion: number;
+  ticker: string;
+  assetType: IndicatorSnapshot["assetType"];
+  nBars: number;
+  columns: { name: string; dtype: "<f4" | "<f8" }[];
+  // Sonlu olmayan sayılar (NaN) JSON'da null olarak yazılır
+  indicators: {
+    [K in keyof IndicatorSnapshot["indicators"]]: IndicatorSnapshot["indicators"][K] | null;
+  };
+  messageIds: {
+    rsi: string;
+    risk: string;
+    trend: string;
+    mainWarning: string | null;
+    mainAction: string | null;
+  };
+}
+
+/**
+ * Binary snapshot'ı çöz
+ * Sütunlar kopyalanmadan typed array olarak döner
+ */
+export function decodeSnapshot(buffer: ArrayBuffer): IndicatorSnapshot {
+  const view = new DataView(buffer);
+  const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 4));
+  if (magic !== SNAPSHOT_MAGIC) {
+    throw new Error("Geçersiz snapshot dosyası");
+  }
+
+  const headerLength = view.getUint32(4, true);
+  const header: SnapshotHeader = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength))
+  );
+  if (header.formatVersion !== SNAPSHOT_FORMAT_VERSION) {
+    throw new Error(`Desteklenmeyen snapshot sürümü: ${header.formatVersion}`);
+  }
+
+  let offset = 8 + headerLength;
+  const series: IndicatorSnapshot["series"] = {};
+  for (const column of header.columns) {
+    if (column.dtype === "<f8") {
+      series[column.name] = new Float64Array(buffer, offset, header.nBars);
+      offset += header.nBars * 8;
+    } else {
+      series[column.name] = new Float32Array(buffer, offset, header.nBars);
+      offset += header.nBars * 4;
+    }
+  }
+
+  return {
+    ticker: header.ticker,
+    assetType: header.assetType,
+    indicators: {
+      rsi: header.indicators.rsi ?? NaN,
+      sma20: header.indicators.sma20 ?? NaN,
+      sma50: header.indicators.sma50 ?? NaN,
+      sma200: header.indicators.sma200 ?? NaN,
+      riskScore: header.indicators.riskScore ?? NaN,
+      volatility: header.indicators.volatility ?? NaN,
+      currentPrice: header.indicators.currentPrice ?? NaN,
+      dataSource: header.indicators.dataSource ?? undefined,
+    },
+    messageIds: {
+      rsi: header.messageIds.rsi,
+      risk: header.messageIds.risk,
+      trend: header.messageIds.trend,
+      mainWarning: header.messageIds.mainWarning ?? undefined,
+      mainAction: header.messageIds.mainAction ?? undefined,
+    },
+    series,
+  };
+}
+
+/**
+ * Manifest'i çek
+ * Statik dosya sunucuları manifest sürümünü ETag olarak döndürmediğinden
+ * sürüm karşılaştırması istemcide yapılır; sürüm değişmemişse null döner
+ */
+export async function fetchManifest(
+  baseUrl: string,
+  version?: string
+): Promise<SnapshotManifest | null> {
+  const response = await fetch(`${baseUrl}/manifest.json`, { cache: "no-cache" });
+  if (!response.ok) {
+    throw new Error(`Manifest çekilemedi: ${response.status}`);
+  }
+  const manifest: SnapshotManifest = await response.json();
+  return manifest.version === version ? null : manifest;
+}
+
+/**
+ * Yalnızca ETag'i değişen sembollerin snapshot'larını çek
+ * cache: ticker -> { etag, snapshot }, yerinde güncellenir
+ */
+export async function syncSnapshots(
+  baseUrl: string,
+  manifest: SnapshotManifest,
+  cache: Map<string, { etag: string; snapshot: IndicatorSnapshot }>
+): Promise<string[]> {
+  const changed = Object.entries(manifest.symbols).filter(
+    ([ticker, entry]) => cache.get(ticker)?.etag !== entry.etag
+  );
+
+  await Promise.all(
+    changed.map(async ([ticker, entry]) => {
+      const response = await fetch(`${baseUrl}/${entry.file}`);
+      if (!response.ok) {
+        throw new Error(`${ticker} snapshot'ı çekilemedi: ${response.status}`);
+      }
+      const snapshot = decodeSnapshot(await response.arrayBuffer());
+      cache.set(ticker, { etag: entry.etag, snapshot });
+    })
+  );
+
+  for (const ticker of Array.from(cache.keys())) {
+    if (!(ticker in manifest.symbols)) cache.delete(ticker);
+  }
+
+  return changed.map(([ticker]) => ticker);
+}
@@ -0,0 +1,290 @@
+"""
+Sembol indeksi - Borsa İstanbul hisseleri, endeksler ve kripto paralar için
+sembol ana verisi, önek (prefix) ağacı ve bulanık (fuzzy) arama
+Kullanıcı girdisi veri çekilmeden önce yerel olarak normalize edilir
+"""
+import csv
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from lib.types import SymbolInfo, AssetType
+
+
+DEFAULT_SYMBOLS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "symbols.csv"
+)
+
+# Her trie düğümünde saklanan en iyi aday sayısı (tümü ve varlık türü başına ayrı)
+TRIE_TOP_K = 20
+# Trie derinliği; daha uzun sorgular son düğümdeki adaylar üzerinden süzülür
+TRIE_MAX_DEPTH = 12
+# Bulanık arama için maksimum düzenleme mesafesi
+MAX_EDIT_DISTANCE = 1
+
+# Sembol girdilerinden temizlenen Yahoo Finance ekleri
+_SYMBOL_SUFFIXES = (".is", "-usd")
+
+# Türkçe karakterleri ASCII karşılıklarına indirger; İ/I/ı/i hepsi "i" olur
+_TURKISH_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ç": "c", "ç": "c",
+    "Ö": "o", "ö": "o",
+    "Ü": "u", "ü": "u",
+})
+
+
+def fold(text: str) -> str:
+    """
+    Türkçe duyarlı büyük/küçük harf katlama
+    "İŞ BANKASI", "iş bankası" ve "is bankasi" aynı anahtara dönüşür
+    """
+    return " ".join(text.translate(_TURKISH_FOLD).lower().split())
+
+
+def _strip_suffix(key: str) -> str:
+    """Katlanmış girdiden Yahoo Finance ekini temizle ("garan.is" -> "garan")"""
+    for suffix in _SYMBOL_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            return key[:-len(suffix)]
+    return key
+
+
+def edit_distance(a: str, b: str, max_distance: int = MAX_EDIT_DISTANCE) -> int:
+    """
+    Damerau-Levenshtein (optimal string alignment) mesafesi
+    max_distance aşılırsa max_distance + 1 döner
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Kelimeden en fazla max_distance karakter silinerek elde edilen varyantlar"""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class _TrieNode:
+    """
+    Önek ağacı düğümü - alt düğümler ve sıralı aday listeleri
+    Aday sayısı TRIE_TOP_K'yı aşan düğümlerde varlık türü başına ayrı liste
+    tutulur; böylece filtrelenen aramalar genel listeyi dolduran diğer
+    türlerin adayları tarafından dışarıda bırakılmaz
+    """
+    __slots__ = ("children", "candidates", "by_type")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.candidates: List[Tuple[int, int, str, int]] = []
+        self.by_type: Optional[Dict[AssetType, List[Tuple[int, int, str, int]]]] = None
+
+
+class SymbolIndex:
+    """
+    Sembol indeksi
+    Önek araması trie üzerinden, bulanık arama önceden hesaplanmış
+    silme varyantları (SymSpell yaklaşımı) üzerinden yapılır.
+    """
+
+    def __init__(self, symbols: Iterable[SymbolInfo]):
+        self.symbols: List[SymbolInfo] = list(symbols)
+        self._by_symbol: Dict[str, List[int]] = {}
+        self._root = _TrieNode()
+        self._fuzzy: Dict[str, Set[int]] = {}
+        self._fuzzy_keys: Dict[int, List[str]] = {}
+        self._prefix_keys: Dict[int, List[str]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        """Trie, sembol tablosu ve bulanık arama indeksini oluştur"""
+        for symbol_id, info in enumerate(self.symbols):
+            symbol_key = fold(info.symbol)
+            name_key = fold(info.name)
+            self._by_symbol.setdefault(symbol_key, []).append(symbol_id)
+
+            # Öncelik: 0 = sembol öneki, 1 = isim öneki
+            words = name_key.split()
+            prefix_keys = [symbol_key] + [" ".join(words[i:]) for i in range(len(words))]
+            self._prefix_keys[symbol_id] = prefix_keys
+            for priority, key in enumerate(prefix_keys):
+                self._insert(key, symbol_id, min(priority, 1))
+
+            fuzzy_keys = [symbol_key] + [word for word in words if len(word) >= 3]
+            self._fuzzy_keys[symbol_id] = fuzzy_keys
+            for key in fuzzy_keys:
+                for variant in _deletes(key, MAX_EDIT_DISTANCE):
+                    self._fuzzy.setdefault(variant, set()).add(symbol_id)
+
+        self._finalize(self._root)
+
+    def _insert(self, key: str, symbol_id: int, priority: int) -> None:
+        """Anahtarın tüm öneklerine adayı ekle"""
+        info = self.symbols[symbol_id]
+        candidate = (priority, len(info.symbol), info.symbol, symbol_id)
+        node = self._root
+        for char in key[:TRIE_MAX_DEPTH]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            node.candidates.append(candidate)
+
+    def _finalize(self, root: _TrieNode) -> None:
+        """
+        Her düğümde adayları sırala, tekilleştir ve TRIE_TOP_K ile sınırla
+        Liste kısaltılan düğümlerde her varlık türü için ayrı TRIE_TOP_K liste tutulur
+        """
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children.values())
+            if len(node.candidates) == 1:
+                continue
+            seen = set()
+            candidates = []
+            by_type: Dict[AssetType, List[Tuple[int, int, str, int]]] = {}
+            for candidate in sorted(node.candidates):
+                if candidate[3] in seen:
+                    continue
+                seen.add(candidate[3])
+                if len(candidates) < TRIE_TOP_K:
+                    candidates.append(candidate)
+                typed = by_type.setdefault(self.symbols[candidate[3]].asset_type, [])
+                if len(typed) < TRIE_TOP_K:
+                    typed.append(candidate)
+            if len(seen) > TRIE_TOP_K:
+                node.by_type = by_type
+            node.candidates = candidates
+
+    def resolve(self, text: str, asset_type: Optional[AssetType] = None) -> Optional[SymbolInfo]:
+        """
+        Kullanıcı girdisini kanonik sembole çevir
+        "garan", "GARAN.IS", "btc-usd" gibi girdiler kabul edilir.
+        Eşleşme yoksa None döner
+        """
+        key = _strip_suffix(fold(text))
+        for symbol_id in self._by_symbol.get(key, []):
+            info = self.symbols[symbol_id]
+            if asset_type is None or info.asset_type == asset_type:
+                return info
+        return None
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        asset_type: Optional[AssetType] = None
+    ) -> List[SymbolInfo]:
+        """
+        Otomatik tamamlama araması
+        Önce sembol ve isim önekleri, önek eşleşmesi yoksa bulanık eşleşmeler döner.
+        Girdideki Yahoo Finance ekleri resolve() gibi temizlenir
+        """
+        key = _strip_suffix(fold(query))
+        if not key:
+            return []
+
+        results: List[SymbolInfo] = []
+        seen: Set[int] = set()
+
+        node = self._root
+        for char in key[:TRIE_MAX_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            check_prefix = len(key) > TRIE_MAX_DEPTH
+            candidates = node.candidates
+            if asset_type is not None and node.by_type is not None:
+                candidates = node.by_type.get(asset_type, [])
+            for _, _, _, symbol_id in candidates:
+                info = self.symbols[symbol_id]
+                if check_prefix and not any(
+                    k.startswith(key) for k in self._prefix_keys[symbol_id]
+                ):
+                    continue
+                if asset_type is None or info.asset_type == asset_type:
+                    results.append(info)
+                    seen.add(symbol_id)
+                    if len(results) == limit:
+                        break
+        if results:
+            return results
+
+        for symbol_id in self._fuzzy_matches(key):
+            info = self.symbols[symbol_id]
+            if symbol_id not in seen and (asset_type is None or info.asset_type == asset_type):
+                results.append(info)
+                if len(results) == limit:
+                    break
+
+        return results
+
+    def _fuzzy_matches(self, key: str) -> List[int]:
+        """
+        Düzenleme mesafesi MAX_EDIT_DISTANCE içindeki sembolleri mesafeye göre sırala
+        Çok kısa girdiler gürültülü sonuç verdiğinden atlanır
+        """
+        if len(key) < 3:
+            return []
+
+        candidates: Set[int] = set()
+        for variant in _deletes(key, MAX_EDIT_DISTANCE):
+            candidates |= self._fuzzy.get(variant, set())
+
+        scored = []
+        for symbol_id in candidates:
+            distance = min(edit_distance(key, k) for k in self._fuzzy_keys[symbol_id])
+            if distance <= MAX_EDIT_DISTANCE:
+                info = self.symbols[symbol_id]
+                scored.append((distance, len(info.name), info.symbol, symbol_id))
+
+        return [symbol_id for _, _, _, symbol_id in sorted(scored)]
+
+
+def load_symbols(path: str = DEFAULT_SYMBOLS_PATH) -> List[SymbolInfo]:
+    """Sembol ana verisini CSV dosyasından yükle"""
+    with open(path, encoding="utf-8", newline="") as f:
+        return [
+            SymbolInfo(
+                symbol=row["symbol"],
+                name=row["name"],
+                kind=row["kind"],
+                asset_type="crypto" if row["kind"] == "crypto" else "stock",
+                yahoo_symbol=row["yahoo_symbol"]
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_symbol_index(path: str = DEFAULT_SYMBOLS_PATH) -> SymbolIndex:
+    """Paketle gelen sembol dosyasından indeksi oluştur (bir kez)"""
+    return SymbolIndex(load_symbols(path))
@@ -1,4 +1,32 @@
-import { TechnicalIndicators, TranslatedInsights } from "./types";
+import { MessageIds, TechnicalIndicators, TranslatedInsights } from "./types";
+
+/**
+ * Mesaj kimlikleri -> Türkçe mesajlar
+ * lib/text_translator.py içindeki MESSAGES ile aynı olmalıdır
+ */
+export const MESSAGES: Record<string, string> = {
+  rsi_very_expensive: "Dikkat! Çok pahalı. Aşırı alım bölgesindesiniz.",
+  rsi_expensive: "Pahalı. Alım için dikkatli olun.",
+  rsi_neutral: "Nötr bölge. Fiyat dengeli görünüyor.",
+  rsi_cheap: "Ucuz. Alım fırsatı olabilir.",
+  rsi_very_cheap: "Çok ucuz! Aşırı satım bölgesindesiniz.",
+  risk_very_high: "Bu hisse Borsa'dan çok daha riskli. Yüksek volatilite var.",
+  risk_high: "Bu hisse Borsa'dan daha riskli. Dikkatli olun.",
+  risk_similar: "Bu hisse Borsa ile benzer risk seviyesinde.",
+  risk_low: "Bu hisse Borsa'dan daha az riskli. Nispeten güvenli.",
+  trend_strong_up: "Güçlü yükseliş trendi. Tüm ortalamaların üzerinde.",
+  trend_up: "Yükseliş trendi devam ediyor.",
+  trend_short_term_up: "Kısa vadede yükseliş var ama uzun vadede dikkatli olun.",
+  trend_down: "Düşüş trendi. Tüm ortalamaların altında.",
+  trend_mixed: "Karışık sinyaller. Dikkatli olun.",
+  warning_overbought: "Aşırı Alım Var!",
+  warning_oversold: "Aşırı Satım Var!",
+  warning_high_risk: "Yüksek Risk!",
+  warning_downtrend: "Düşüş Trendi!",
+  action_sell: "Satış düşünebilirsiniz",
+  action_buy_opportunity: "Alım fırsatı olabilir",
+  action_uptrend: "Yükseliş trendi devam ediyor",
+};
 
 /**
  * Finansal göstergeleri Türkçe mesajlara çeviren ana fonksiyon
@@ -6,63 +34,77 @@ import { TechnicalIndicators, TranslatedInsights } from "./types";
 export function translateIndicators(
   indicators: TechnicalIndicators
 ): TranslatedInsights {
-  const rsiMessage = translateRSI(indicators.rsi);
-  const riskMessage = translateRisk(indicators.riskScore, indicators.volatility);
-  const trendMessage = translateTrend(
-    indicators.currentPrice,
-    indicators.sma20,
-    indicators.sma50,
-    indicators.sma200
-  );
+  return translateMessageIds(getMessageIds(indicators));
+}
 
-  const mainWarning = determineMainWarning(indicators);
-  const mainAction = determineMainAction(indicators);
+/**
+ * Mesaj kimliklerini Türkçe mesajlara çevir
+ * Snapshot'tan gelen kimlikler için de kullanılır
+ */
+export function translateMessageIds(ids: MessageIds): TranslatedInsights {
+  return {
+    rsiMessage: MESSAGES[ids.rsi],
+    riskMessage: MESSAGES[ids.risk],
+    trendMessage: MESSAGES[ids.trend],
+    mainWarning: ids.mainWarning ? MESSAGES[ids.mainWarning] : undefined,
+    mainAction: ids.mainAction ? MESSAGES[ids.mainAction] : undefined,
+  };
+}
 
+/**
+ * Göstergeler için mesaj kimliklerini belirle
+ */
+export function getMessageIds(indicators: TechnicalIndicators): MessageIds {
   return {
-    rsiMessage,
-    riskMessage,
-    trendMessage,
-    mainWarning,
-    mainAction,
+    rsi: rsiMessageId(indicators.rsi),
+    risk: riskMessageId(indicators.riskScore),
+    trend: trendMessageId(
+      indicators.currentPrice,
+      indicators.sma20,
+      indicators.sma50,
+      indicators.sma200
+    ),
+    mainWarning: mainWarningId(indicators),
+    mainAction: mainActionId(indicators),
   };
 }
 
 /**
- * RSI değerini Türkçe mesaja çevir
+ * RSI mesaj kimliğini belirle
  */
-function translateRSI(rsi: number): string {
+function rsiMessageId(rsi: number): string {
   if (rsi >= 80) {
-    return "Dikkat! Çok pahalı. Aşırı alım bölgesindesiniz.";
+    return "rsi_very_expensive";
   } else if (rsi >= 70) {
-    return "Pahalı. Alım için dikkatli olun.";
+    return "rsi_expensive";
   } else if (rsi >= 50) {
-    return "Nötr bölge. Fiyat dengeli görünüyor.";
+    return "rsi_neutral";
   } else if (rsi >= 30) {
-    return "Ucuz. Alım fırsatı olabilir.";
+    return "rsi_cheap";
   } else {
-    return "Çok ucuz! Aşırı satım bölgesindesiniz.";
+    return "rsi_very_cheap";
   }
 }
 
 /**
- * Risk seviyesini Türkçe mesaja çevir
+ * Risk mesaj kimliğini belirle
  */
-function translateRisk(riskScore: number, volatility: number): string {
+function riskMessageId(riskScore: number): string {
   if (riskScore >= 70) {
-    return "Bu hisse Borsa'dan çok daha riskli. Yüksek volatilite var.";
+    return "risk_very_high";
   } else if (riskScore >= 50) {
-    return "Bu hisse Borsa'dan daha riskli. Dikkatli olun.";
+    return "risk_high";
   } else if (riskScore >= 30) {
-    return "Bu hisse Borsa ile benzer risk seviyesinde.";
+    return "risk_similar";
   } else {
-    return "Bu hisse Borsa'dan daha az riskli. Nispeten güvenli.";
+    return "risk_low";
   }
 }
 
 /**
- * Trend analizini Türkçe mesaja çevir
+ * Trend mesaj kimliğini belirle
  */
-function translateTrend(
+function trendMessageId(
   currentPrice: number,
   sma20: number,
   sma50: number,
@@ -73,51 +115,51 @@ function translateTrend(
   const above200 = currentPrice > sma200;
 
   if (above20 && above50 && above200) {
-    return "Güçlü yükseliş trendi. Tüm ortalamaların üzerinde.";
+    return "trend_strong_up";
   } else if (above20 && above50) {
-    return "Yükseliş trendi devam ediyor.";
+    return "trend_up";
   } else if (above20) {
-    return "Kısa vadede yükseliş var ama uzun vadede dikkatli olun.";
+    return "trend_short_term_up";
   } else if (!above20 && !above50 && !above200) {
-    return "Düşüş trendi. Tüm ortalamaların altında.";
+    return "trend_down";
   } else {
-    return "Karışık sinyaller. Dikkatli olun.";
+    return "trend_mixed";
   }
 }
 
 /**
- * Ana uyarı mesajını belirle
+ * Ana uyarı mesaj kimliğini belirle
  */
-function determineMainWarning(indicators: TechnicalIndicators): string | undefined {
+function mainWarningId(indicators: TechnicalIndicators): string | undefined {
   if (indicators.rsi >= 80) {
-    return "Aşırı Alım Var!";
+    return "warning_overbought";
   } else if (indicators.rsi <= 20) {
-    return "Aşırı Satım Var!";
+    return "warning_oversold";
   } else if (indicators.riskScore >= 70) {
-    return "Yüksek Risk!";
+    return "warning_high_risk";
   } else if (
     indicators.currentPrice < indicators.sma200 &&
     indicators.currentPrice < indicators.sma50
   ) {
-    return "Düşüş Trendi!";
+    return "warning_downtrend";
   }
   return undefined;
 }
 
 /**
- * Ana aksiyon mesajını belirle
+ * Ana aksiyon mesaj kimliğini belirle
  */
-function determineMainAction(indicators: TechnicalIndicators): string | undefined {
+function mainActionId(indicators: TechnicalIndicators): string | undefined {
   if (indicators.rsi >= 80) {
-    return "Satış düşünebilirsiniz";
+    return "action_sell";
   } else if (indicators.rsi <= 20 && indicators.riskScore < 50) {
-    return "Alım fırsatı olabilir";
+    return "action_buy_opportunity";
   } else if (
     indicators.currentPrice > indicators.sma20 &&
     indicators.currentPrice > indicators.sma50 &&
     indicators.riskScore < 50
   ) {
-    return "Yükseliş trendi devam ediyor";
+    return "action_uptrend";
   }
   return undefined;
 }
@@ -131,5 +173,3 @@ export function getRiskLevel(riskScore: number): "Düşük" | "Orta" | "Yüksek"
   if (riskScore < 70) return "Yüksek";
   return "Çok Yüksek";
 }
-
-
@@ -1,7 +1,7 @@
 """
 Text Translator modülü - Finansal göstergeleri Türkçe mesajlara çevirir
 """
-from typing import Optional
+from typing import Dict, Optional
 from lib.types import TechnicalIndicators, TranslatedInsights
 
 
@@ -30,83 +30,158 @@ def translate_indicators(indicators: TechnicalIndicators) -> TranslatedInsights:
     )
 
 
+# Mesaj kimlikleri -> Türkçe mesajlar
+# Kimlikler snapshot'larda ve front end'de mesaj metni yerine taşınır
+MESSAGES = {
+    "rsi_very_expensive": "Dikkat! Çok pahalı. Aşırı alım bölgesindesiniz.",
+    "rsi_expensive": "Pahalı. Alım için dikkatli olun.",
+    "rsi_neutral": "Nötr bölge. Fiyat dengeli görünüyor.",
+    "rsi_cheap": "Ucuz. Alım fırsatı olabilir.",
+    "rsi_very_cheap": "Çok ucuz! Aşırı satım bölgesindesiniz.",
+    "risk_very_high": "Bu hisse Borsa'dan çok daha riskli. Yüksek volatilite var.",
+    "risk_high": "Bu hisse Borsa'dan daha riskli. Dikkatli olun.",
+    "risk_similar": "Bu hisse Borsa ile benzer risk seviyesinde.",
+    "risk_low": "Bu hisse Borsa'dan daha az riskli. Nispeten güvenli.",
+    "trend_strong_up": "Güçlü yükseliş trendi. Tüm ortalamaların üzerinde.",
+    "trend_up": "Yükseliş trendi devam ediyor.",
+    "trend_short_term_up": "Kısa vadede yükseliş var ama uzun vadede dikkatli olun.",
+    "trend_down": "Düşüş trendi. Tüm ortalamaların altında.",
+    "trend_mixed": "Karışık sinyaller. Dikkatli olun.",
+    "warning_overbought": "Aşırı Alım Var!",
+    "warning_oversold": "Aşırı Satım Var!",
+    "warning_high_risk": "Yüksek Risk!",
+    "warning_downtrend": "Düşüş Trendi!",
+    "action_sell": "Satış düşünebilirsiniz",
+    "action_buy_opportunity": "Alım fırsatı olabilir",
+    "action_uptrend": "Yükseliş trendi devam ediyor",
+}
+
+
+def get_message_ids(indicators: TechnicalIndicators) -> Dict[str, Optional[str]]:
+    """Göstergeler için mesaj kimliklerini belirle"""
+    return {
+        "rsi": rsi_message_id(indicators.rsi),
+        "risk": risk_message_id(indicators.risk_score),
+        "trend": trend_message_id(
+            indicators.current_price,
+            indicators.sma20,
+            indicators.sma50,
+            indicators.sma200
+        ),
+        "main_warning": main_warning_id(indicators),
+        "main_action": main_action_id(indicators),
+    }
+
+
 def translate_rsi(rsi: float) -> str:
     """RSI değerini Türkçe mesaja çevir"""
+    return MESSAGES[rsi_message_id(rsi)]
+
+
+def translate_risk(risk_score: float, volatility: float) -> str:
+    """Risk seviyesini Türkçe mesaja çevir"""
+    return MESSAGES[risk_message_id(risk_score)]
+
+
+def translate_trend(
+    current_price: float,
+    sma20: float,
+    sma50: float,
+    sma200: float
+) -> str:
+    """Trend analizini Türkçe mesaja çevir"""
+    return MESSAGES[trend_message_id(current_price, sma20, sma50, sma200)]
+
+
+def determine_main_warning(indicators: TechnicalIndicators) -> Optional[str]:
+    """Ana uyarı mesajını belirle"""
+    message_id = main_warning_id(indicators)
+    return MESSAGES[message_id] if message_id else None
+
+
+def determine_main_action(indicators: TechnicalIndicators) -> Optional[str]:
+    """Ana aksiyon mesajını belirle"""
+    message_id = main_action_id(indicators)
+    return MESSAGES[message_id] if message_id else None
+
+
+def rsi_message_id(rsi: float) -> str:
+    """RSI mesaj kimliğini belirle"""
     if rsi >= 80:
-        return "Dikkat! Çok pahalı. Aşırı alım bölgesindesiniz."
+        return "rsi_very_expensive"
     elif rsi >= 70:
-        return "Pahalı. Alım için dikkatli olun."
+        return "rsi_expensive"
     elif rsi >= 50:
-        return "Nötr bölge. Fiyat dengeli görünüyor."
+        return "rsi_neutral"
     elif rsi >= 30:
-        return "Ucuz. Alım fırsatı olabilir."
+        return "rsi_cheap"
     else:
-        return "Çok ucuz! Aşırı satım bölgesindesiniz."
+        return "rsi_very_cheap"
 
 
-def translate_risk(risk_score: float, volatility: float) -> str:
-    """Risk seviyesini Türkçe mesaja çevir"""
+def risk_message_id(risk_score: float) -> str:
+    """Risk mesaj kimliğini belirle"""
     if risk_score >= 70:
-        return "Bu hisse Borsa'dan çok daha riskli. Yüksek volatilite var."
+        return "risk_very_high"
     elif risk_score >= 50:
-        return "Bu hisse Borsa'dan daha riskli. Dikkatli olun."
+        return "risk_high"
     elif risk_score >= 30:
-        return "Bu hisse Borsa ile benzer risk seviyesinde."
+        return "risk_similar"
     else:
-        return "Bu hisse Borsa'dan daha az riskli. Nispeten güvenli."
+        return "risk_low"
 
 
-def translate_trend(
+def trend_message_id(
     current_price: float,
     sma20: float,
     sma50: float,
     sma200: float
 ) -> str:
-    """Trend analizini Türkçe mesaja çevir"""
+    """Trend mesaj kimliğini belirle"""
     above_20 = current_price > sma20
     above_50 = current_price > sma50
     above_200 = current_price > sma200
     
     if above_20 and above_50 and above_200:
-        return "Güçlü yükseliş trendi. Tüm ortalamaların üzerinde."
+        return "trend_strong_up"
     elif above_20 and above_50:
-        return "Yükseliş trendi devam ediyor."
+        return "trend_up"
     elif above_20:
-        return "Kısa vadede yükseliş var ama uzun vadede dikkatli olun."
+        return "trend_short_term_up"
     elif not above_20 and not above_50 and not above_200:
-        return "Düşüş trendi. Tüm ortalamaların altında."
+        return "trend_down"
     else:
-        return "Karışık sinyaller. Dikkatli olun."
+        return "trend_mixed"
 
 
-def determine_main_warning(indicators: TechnicalIndicators) -> Optional[str]:
-    """Ana uyarı mesajını belirle"""
+def main_warning_id(indicators: TechnicalIndicators) -> Optional[str]:
+    """Ana uyarı mesaj kimliğini belirle"""
     if indicators.rsi >= 80:
-        return "Aşırı Alım Var!"
+        return "warning_overbought"
     elif indicators.rsi <= 20:
-        return "Aşırı Satım Var!"
+        return "warning_oversold"
     elif indicators.risk_score >= 70:
-        return "Yüksek Risk!"
+        return "warning_high_risk"
     elif (
         indicators.current_price < indicators.sma200 and
         indicators.current_price < indicators.sma50
     ):
-        return "Düşüş Trendi!"
+        return "warning_downtrend"
     return None
 
 
-def determine_main_action(indicators: TechnicalIndicators) -> Optional[str]:
-    """Ana aksiyon mesajını belirle"""
+def main_action_id(indicators: TechnicalIndicators) -> Optional[str]:
+    """Ana aksiyon mesaj kimliğini belirle"""
     if indicators.rsi >= 80:
-        return "Satış düşünebilirsiniz"
+        return "action_sell"
     elif indicators.rsi <= 20 and indicators.risk_score < 50:
-        return "Alım fırsatı olabilir"
+        return "action_buy_opportunity"
     elif (
         indicators.current_price > indicators.sma20 and
         indicators.current_price > indicators.sma50 and
         indicators.risk_score < 50
     ):
-        return "Yükseliş trendi devam ediyor"
+        return "action_uptrend"
     return None
 
 
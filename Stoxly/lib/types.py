@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from datetime import datetime
 
+# Verinin kaynağı: canlı, önbellekten (bayat) veya mock
+DataSource = Literal["live", "stale", "mock"]
+
 @dataclass
 class PriceData:
     """Fiyat verisi için data class"""
@@ -11,6 +14,7 @@ class PriceData:
     low: float
     close: float
     volume: float
+    source: DataSource = "live"
 
 @dataclass
 class TechnicalIndicators:
@@ -22,6 +26,7 @@ class TechnicalIndicators:
     risk_score: float
     volatility: float
     current_price: float
+    data_source: DataSource = "live"
 
 @dataclass
 class TranslatedInsights:
@@ -41,3 +46,23 @@ class AnalysisResult:
 
 AssetType = Literal["stock", "crypto"]
 
+@dataclass
+class IndicatorSnapshot:
+    """Front end'e yayınlanan sembol snapshot'ı için data class"""
+    ticker: str
+    asset_type: AssetType
+    indicators: TechnicalIndicators
+    message_ids: Dict[str, Optional[str]]
+    series: Dict[str, Any]
+
+
+SymbolKind = Literal["equity", "index", "crypto"]
+
+@dataclass
+class SymbolInfo:
+    """Sembol ana verisi için data class"""
+    symbol: str
+    name: str
+    kind: SymbolKind
+    asset_type: AssetType
+    yahoo_symbol: str
@@ -5,6 +5,7 @@ export interface PriceData {
   low: number;
   close: number;
   volume: number;
+  source?: DataSource;
 }
 
 export interface TechnicalIndicators {
@@ -15,6 +16,7 @@ export interface TechnicalIndicators {
   riskScore: number;
   volatility: number;
   currentPrice: number;
+  dataSource?: DataSource;
 }
 
 export interface AnalysisResult {
@@ -31,8 +33,18 @@ export interface TranslatedInsights {
   mainAction?: string;
 }
 
+export interface MessageIds {
+  rsi: string;
+  risk: string;
+  trend: string;
+  mainWarning?: string;
+  mainAction?: string;
+}
+
 export type AssetType = "stock" | "crypto";
 
+export type DataSource = "live" | "stale" | "mock";
+
 export interface Asset {
   ticker: string;
   name: string;
@@ -40,3 +52,18 @@ export interface Asset {
 }
 
 
+
+export interface IndicatorSnapshot {
+  ticker: string;
+  assetType: AssetType;
+  indicators: TechnicalIndicators;
+  messageIds: MessageIds;
+  series: Record<string, Float32Array | Float64Array>;
+}
+
+export interface SnapshotManifest {
+  formatVersion: number;
+  version: string;
+  generatedAt: string;
+  symbols: Record<string, { etag: string; file: string; assetType: AssetType }>;
+}
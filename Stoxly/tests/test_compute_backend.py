@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from lib import compute_backend
+from lib.financial_analysis import calculate_rsi_matrix, calculate_ema_matrix
+
+
+def _ragged_closes(n_symbols=32, n_bars=300, seed=0, gap_ratio=0.0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, (n_symbols, n_bars)), axis=1)
+    for i, start in enumerate(rng.integers(0, n_bars, n_symbols // 2)):
+        closes[i, :start] = np.nan
+    closes[rng.random((n_symbols, n_bars)) < gap_ratio] = np.nan
+    return closes
+
+
+@pytest.mark.skipif("numba" not in compute_backend.available_backends(), reason="Numba kurulu değil")
+@pytest.mark.parametrize("period", [2, 14, 50])
+def test_numba_matches_numpy(period):
+    closes = _ragged_closes(gap_ratio=0.05)
+    for alpha in (1.0 / period, 2.0 / (period + 1)):
+        expected = compute_backend.get_backend("numpy").smooth(closes, period, alpha)
+        actual = compute_backend.get_backend("numba").smooth(closes, period, alpha)
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.skipif("numba" not in compute_backend.available_backends(), reason="Numba kurulu değil")
+def test_verify_backends_reports_numba():
+    assert compute_backend.verify_backends() == {"numba": True}
+
+
+@pytest.mark.parametrize("backend", compute_backend.available_backends())
+def test_leading_nans_match_trimmed_series(backend):
+    closes = _ragged_closes(n_symbols=1, n_bars=120, seed=3)[0]
+    closes[:40] = np.nan
+
+    rsi = calculate_rsi_matrix(closes, backend=backend)[0]
+    ema = calculate_ema_matrix(closes, 20, backend=backend)[0]
+
+    assert np.isnan(rsi[:40 + 14]).all()
+    np.testing.assert_allclose(rsi[40:], calculate_rsi_matrix(closes[40:], backend=backend)[0], equal_nan=True)
+    np.testing.assert_allclose(ema[40:], calculate_ema_matrix(closes[40:], 20, backend=backend)[0], equal_nan=True)
+
+
+@pytest.mark.parametrize("backend", compute_backend.available_backends())
+def test_too_short_rows_are_all_nan(backend):
+    closes = np.full((2, 30), np.nan)
+    closes[1, -5:] = 10.0
+    assert np.isnan(calculate_rsi_matrix(closes, backend=backend)).all()
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        compute_backend.get_backend("cuda")
+
+
+@pytest.mark.parametrize("backend", compute_backend.available_backends())
+def test_interior_gap_does_not_poison_row(backend):
+    closes = _ragged_closes(n_symbols=1, n_bars=300, seed=5)[0]
+    closes[50] = np.nan
+
+    rsi = calculate_rsi_matrix(closes, backend=backend)[0]
+    ema = calculate_ema_matrix(closes, 20, backend=backend)[0]
+
+    # Boşluk yalnızca kendi barını (RSI'da sonraki değişimi de) etkiler
+    assert np.isnan(rsi[50:52]).all() and not np.isnan(rsi[52:]).any()
+    assert np.isnan(ema[50]) and not np.isnan(ema[51:]).any()
+
+
+@pytest.mark.parametrize("backend", compute_backend.available_backends())
+def test_gaps_match_series_without_gaps(backend):
+    closes = _ragged_closes(n_symbols=1, n_bars=200, seed=7, gap_ratio=0.1)[0]
+    valid = ~np.isnan(closes)
+
+    ema = calculate_ema_matrix(closes, 20, backend=backend)[0]
+
+    assert np.isnan(ema[~valid]).all()
+    np.testing.assert_allclose(
+        ema[valid], calculate_ema_matrix(closes[valid], 20, backend=backend)[0], equal_nan=True
+    )
@@ -0,0 +1,74 @@
+import json
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from lib.financial_analysis import (
+    calculate_rsi,
+    calculate_rsi_series,
+    calculate_sma,
+    calculate_sma_series,
+    round_half_up,
+)
+from lib.snapshot import GOLDEN_VECTORS_PATH, golden_vector_case
+from lib.types import PriceData
+
+
+def _cases():
+    with open(GOLDEN_VECTORS_PATH, encoding="utf-8") as f:
+        return json.load(f)["cases"]
+
+
+@pytest.mark.parametrize("case", _cases(), ids=lambda case: case["name"])
+def test_golden_vector_case(case):
+    actual = golden_vector_case(case["name"], case["closes"])
+    assert actual["indicators"] == case["indicators"]
+    assert actual["messageIds"] == case["messageIds"]
+
+
+def test_fixture_covers_half_tie():
+    # Math.round ile round() arasındaki farkın fixture'da yakalandığından emin ol
+    tie = next(case for case in _cases() if case["name"] == "half_tie_flat")
+    assert tie["indicators"]["sma20"] == 10.13
+
+
+@pytest.mark.parametrize("value, digits, expected", [
+    (10.125, 2, 10.13),
+    (2.675, 2, 2.68),
+    (0.5, 0, 1),
+    (1.5, 0, 2),
+    (2.5, 0, 3),
+    (-2.5, 0, -2),
+    (-2.6, 0, -3),
+    (math.inf, 2, math.inf),
+    (-math.inf, 0, -math.inf),
+])
+def test_round_half_up_matches_math_round(value, digits, expected):
+    assert round_half_up(value, digits) == expected
+
+
+@pytest.mark.parametrize("digits", [0, 2])
+def test_round_half_up_passes_nan_through(digits):
+    # Math.round(NaN) NaN döndürür
+    assert math.isnan(round_half_up(math.nan, digits))
+
+
+@pytest.mark.parametrize("name", ["oscillating", "uptrend_noisy", "volatile"])
+def test_series_match_scalar_indicators(name):
+    closes = next(case for case in _cases() if case["name"] == name)["closes"]
+    values = np.array(closes)
+    sma = calculate_sma_series(values, 20)
+    rsi = calculate_rsi_series(values)
+
+    for end in (20, len(closes) // 2, len(closes)):
+        prices = [
+            PriceData(date=datetime(2024, 1, 1), open=c, high=c, low=c, close=c, volume=0.0)
+            for c in closes[:end]
+        ]
+        assert round_half_up(sma[end - 1], 2) == calculate_sma(prices, 20)
+        assert round_half_up(rsi[end - 1], 2) == calculate_rsi(prices)
+
+    assert np.isnan(sma[:19]).all()
+    assert np.isnan(rsi[:14]).all()
@@ -0,0 +1,56 @@
+import pytest
+
+from lib import mock_service
+from lib.symbol_index import get_symbol_index
+from tools.load_test import LoadTestConfig, format_report, run_load_test, summarize
+
+
+@pytest.fixture
+def negative_cache_at_exit(monkeypatch):
+    """run_load_test çıkışta önbellekleri temizler; temizlenmeden önceki negatif önbelleği yakala"""
+    captured = {}
+    original = mock_service.clear_caches
+
+    def clear_caches():
+        captured.clear()
+        captured.update(mock_service._negative_cache)
+        original()
+
+    monkeypatch.setattr(mock_service, "clear_caches", clear_caches)
+    # Kısa testte aynı yazım hatası iki kez görülmeyebilir
+    monkeypatch.setattr(mock_service, "NEGATIVE_CACHE_MISSES", 1)
+    return captured
+
+
+def test_load_test_smoke(negative_cache_at_exit):
+    factory = mock_service.ticker_factory
+    config = LoadTestConfig(users=2, duration=0.2, invalid_ratio=0.5, sample_interval=0.05)
+
+    result = run_load_test(config)
+    summary = summarize(result)
+
+    assert mock_service.ticker_factory is factory
+    assert summary["errors"] == 0
+
+    total = summary["requests"]["total"]
+    assert total["count"] > 0
+    assert total["p50_ms"] <= total["p95_ms"] <= total["p99_ms"] <= total["max_ms"]
+    assert len(summary["memory_mb"]["samples"]) >= 2
+    assert "Bellek (MB)" in format_report(summary)
+
+    known = {info.yahoo_symbol for info in get_symbol_index().symbols}
+    assert negative_cache_at_exit
+    assert not known & set(negative_cache_at_exit)
+
+
+def test_load_test_restores_factory_on_error(monkeypatch):
+    factory = mock_service.ticker_factory
+
+    def broken_start(self):
+        raise RuntimeError("thread başlatılamadı")
+
+    monkeypatch.setattr("tools.load_test.threading.Thread.start", broken_start)
+    with pytest.raises(RuntimeError):
+        run_load_test(LoadTestConfig(users=2, duration=0.2))
+
+    assert mock_service.ticker_factory is factory
@@ -0,0 +1,135 @@
+import warnings
+
+import pandas as pd
+import pytest
+import yfinance as yf
+from yfinance.exceptions import YFPricesMissingError
+
+from lib import mock_service
+from lib.mock_service import fetch_stock_data, fetch_crypto_data
+
+
+class FakeProvider:
+    """ticker_factory yerine geçen sağlayıcı; sembol başına çağrıları sayar"""
+
+    def __init__(self, frames=None, error=None):
+        self.frames = frames or {}
+        self.error = error
+        self.calls = {}
+        self.kwargs = []
+
+    def __call__(self, symbol):
+        provider = self
+
+        class _Ticker:
+            def history(self, period="1y", **kwargs):
+                provider.calls[symbol] = provider.calls.get(symbol, 0) + 1
+                provider.kwargs.append(kwargs)
+                if provider.error is not None:
+                    raise provider.error
+                if symbol not in provider.frames:
+                    raise YFPricesMissingError(symbol, "")
+                return provider.frames[symbol]
+
+        return _Ticker()
+
+
+def _frame(n_bars=30, price=10.0):
+    return pd.DataFrame(
+        {"Open": price, "High": price, "Low": price, "Close": price, "Volume": 1000.0},
+        index=pd.bdate_range(end="2024-12-31", periods=n_bars)
+    )
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    fake = FakeProvider()
+    monkeypatch.setattr(mock_service, "ticker_factory", fake)
+    mock_service.clear_caches()
+    yield fake
+    mock_service.clear_caches()
+
+
+def test_listed_symbol_is_never_negative_cached(provider):
+    for _ in range(3):
+        prices = fetch_stock_data("GARAN")
+        assert prices[0].source == "mock"
+    assert provider.calls["GARAN.IS"] == 3
+
+
+def test_unlisted_symbol_is_negative_cached_after_repeated_misses(provider):
+    results = [fetch_stock_data("ZZZZ") for _ in range(4)]
+
+    assert provider.calls["ZZZZ.IS"] == mock_service.NEGATIVE_CACHE_MISSES
+    assert all(prices is results[0] for prices in results)
+    assert results[0][0].source == "mock"
+
+
+def test_success_resets_miss_count(provider):
+    fetch_stock_data("ZZZZ")
+    provider.frames["ZZZZ.IS"] = _frame()
+    assert fetch_stock_data("ZZZZ")[0].source == "live"
+
+    del provider.frames["ZZZZ.IS"]
+    fetch_stock_data("ZZZZ")
+    fetch_stock_data("ZZZZ")
+    assert provider.calls["ZZZZ.IS"] == 4
+
+
+def test_negative_cache_is_bounded_and_purges_expired(provider, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mock_service.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(mock_service, "NEGATIVE_CACHE_SIZE", 3)
+
+    for i in range(5):
+        mock_service._record_miss(f"SYM{i}")
+    assert list(mock_service._negative_cache) == ["SYM2", "SYM3", "SYM4"]
+
+    now[0] += mock_service.NEGATIVE_CACHE_TTL
+    mock_service._record_miss("NEW")
+    assert list(mock_service._negative_cache) == ["NEW"]
+
+
+def test_open_breaker_returns_same_mock_without_regenerating(provider, monkeypatch):
+    provider.error = ConnectionError("yahoo down")
+    generated = []
+    original = mock_service.generate_mock_data
+    monkeypatch.setattr(
+        mock_service,
+        "generate_mock_data",
+        lambda *args, **kwargs: generated.append(args) or original(*args, **kwargs)
+    )
+
+    results = [fetch_crypto_data("BTC") for _ in range(5)]
+
+    assert mock_service.CIRCUIT_BREAKERS["yahoo"].is_open
+    assert provider.calls["BTC-USD"] == mock_service.CIRCUIT_BREAKERS["yahoo"].failure_threshold
+    assert len(generated) == 1
+    assert all(prices is results[0] for prices in results)
+
+
+def test_mock_data_is_deterministic_per_symbol():
+    first = mock_service.generate_mock_data("ABC", seed=42)
+    second = mock_service.generate_mock_data("ABC", seed=42)
+    assert [p.close for p in first] == [p.close for p in second]
+
+
+def test_failure_after_success_returns_stale_data(provider):
+    provider.frames["GARAN.IS"] = _frame()
+    assert fetch_stock_data("GARAN")[0].source == "live"
+
+    provider.error = ConnectionError("yahoo down")
+    prices = fetch_stock_data("GARAN")
+    assert prices[0].source == "stale"
+    assert prices[0].close == 10.0
+
+
+@pytest.mark.skipif(not hasattr(yf, "config"), reason="yfinance 1.x yapılandırması yok")
+def test_exceptions_enabled_via_config_not_deprecated_argument(provider):
+    assert yf.config.debug.hide_exceptions is False
+
+    provider.frames["GARAN.IS"] = _frame()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        fetch_stock_data("GARAN")
+    assert provider.kwargs == [{}]
@@ -0,0 +1,165 @@
+import json
+import math
+import os
+import struct
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from lib import snapshot
+from lib.snapshot import (
+    MANIFEST_FILE,
+    SERIES_COLUMNS,
+    build_snapshot,
+    decode_snapshot,
+    encode_snapshot,
+    publish_snapshots,
+)
+from lib.types import PriceData
+
+
+def _prices(n_bars=60, start=50.0, step=0.3, source="live"):
+    first = datetime(2024, 1, 1)
+    return [
+        PriceData(
+            date=first + timedelta(days=i),
+            open=start + step * i,
+            high=start + step * i,
+            low=start + step * i,
+            close=start + step * i,
+            volume=1000.0,
+            source=source
+        )
+        for i in range(n_bars)
+    ]
+
+
+def _strict_json(text):
+    def reject(constant):
+        raise ValueError(f"JSON'da geçersiz sabit: {constant}")
+    return json.loads(text, parse_constant=reject)
+
+
+@pytest.mark.parametrize("n_bars", [1, 3, 25, 60])
+def test_encode_decode_round_trip(n_bars):
+    original = build_snapshot("GARAN", "stock", _prices(n_bars))
+    data = encode_snapshot(original)
+    decoded = decode_snapshot(data)
+
+    assert decoded.ticker == "GARAN"
+    assert decoded.asset_type == "stock"
+    assert decoded.indicators == original.indicators
+    assert decoded.message_ids == original.message_ids
+    for name, dtype in SERIES_COLUMNS:
+        np.testing.assert_array_equal(
+            decoded.series[name], np.asarray(original.series[name], dtype=dtype)
+        )
+
+
+@pytest.mark.parametrize("n_bars", [1, 3, 25, 60])
+def test_columns_are_8_byte_aligned(n_bars):
+    data = encode_snapshot(build_snapshot("GARAN", "stock", _prices(n_bars)))
+    (header_length,) = struct.unpack_from("<I", data, 4)
+
+    offset = 8 + header_length
+    assert offset % 8 == 0
+    for _, dtype in SERIES_COLUMNS:
+        assert offset % np.dtype(dtype).itemsize == 0
+        offset += n_bars * np.dtype(dtype).itemsize
+    assert offset == len(data)
+
+
+def test_non_finite_indicators_are_written_as_null():
+    prices = _prices()
+    prices[-1] = replace(prices[-1], close=math.nan)
+    original = build_snapshot("GARAN", "stock", prices)
+    assert math.isnan(original.indicators.current_price)
+
+    data = encode_snapshot(original)
+    (header_length,) = struct.unpack_from("<I", data, 4)
+    header = _strict_json(data[8:8 + header_length].decode("utf-8"))
+    assert header["indicators"]["currentPrice"] is None
+
+    decoded = decode_snapshot(data)
+    assert math.isnan(decoded.indicators.current_price)
+    assert decoded.indicators.data_source == "live"
+
+
+@pytest.fixture
+def universe_data(monkeypatch):
+    """publish_snapshots için sembol -> fiyat verisi (fetch_data yerine)"""
+    data = {}
+    monkeypatch.setattr(snapshot, "fetch_data", lambda ticker, asset_type, period: data[ticker])
+    return data
+
+
+def _read_manifest(output_dir):
+    with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_publish_skips_unchanged_files(universe_data, tmp_path):
+    universe_data["GARAN"] = _prices()
+    universe_data["BTC"] = _prices(start=30000.0)
+    universe = [("GARAN", "stock"), ("BTC", "crypto")]
+    first = publish_snapshots(universe, str(tmp_path))
+
+    garan_path = tmp_path / first["symbols"]["GARAN"]["file"]
+    btc_path = tmp_path / first["symbols"]["BTC"]["file"]
+    os.utime(garan_path, ns=(0, 0))
+    os.utime(btc_path, ns=(0, 0))
+
+    universe_data["BTC"] = _prices(start=31000.0)
+    second = publish_snapshots(universe, str(tmp_path))
+
+    assert second["symbols"]["GARAN"] == first["symbols"]["GARAN"]
+    assert os.stat(garan_path).st_mtime_ns == 0
+    assert second["symbols"]["BTC"]["etag"] != first["symbols"]["BTC"]["etag"]
+    assert os.stat(btc_path).st_mtime_ns != 0
+    assert second["version"] != first["version"]
+
+
+def test_publish_unchanged_universe_keeps_manifest(universe_data, tmp_path):
+    universe_data["GARAN"] = _prices()
+    first = publish_snapshots([("GARAN", "stock")], str(tmp_path))
+    second = publish_snapshots([("GARAN", "stock")], str(tmp_path))
+
+    assert second == first
+    assert _read_manifest(tmp_path)["generatedAt"] == first["generatedAt"]
+
+
+def test_publish_keeps_previous_entry_for_mock_data(universe_data, tmp_path):
+    universe_data["GARAN"] = _prices()
+    first = publish_snapshots([("GARAN", "stock")], str(tmp_path))
+
+    universe_data["GARAN"] = _prices(start=70.0, source="mock")
+    second = publish_snapshots([("GARAN", "stock")], str(tmp_path))
+
+    assert second["symbols"]["GARAN"] == first["symbols"]["GARAN"]
+    assert second["version"] == first["version"]
+    assert (tmp_path / first["symbols"]["GARAN"]["file"]).exists()
+
+
+def test_publish_does_not_add_mock_only_symbol(universe_data, tmp_path):
+    universe_data["ZZZZ"] = _prices(source="mock")
+    manifest = publish_snapshots([("ZZZZ", "stock")], str(tmp_path))
+
+    assert manifest["symbols"] == {}
+    assert not (tmp_path / "ZZZZ.stxs").exists()
+
+
+def test_publish_drops_symbol_and_its_file(universe_data, tmp_path):
+    universe_data["GARAN"] = _prices()
+    universe_data["AKBNK"] = _prices(start=40.0)
+    first = publish_snapshots([("GARAN", "stock"), ("AKBNK", "stock")], str(tmp_path))
+    akbnk_path = tmp_path / first["symbols"]["AKBNK"]["file"]
+    assert akbnk_path.exists()
+
+    second = publish_snapshots([("GARAN", "stock")], str(tmp_path))
+
+    assert set(second["symbols"]) == {"GARAN"}
+    assert second["version"] != first["version"]
+    assert not akbnk_path.exists()
+    assert _read_manifest(tmp_path) == second
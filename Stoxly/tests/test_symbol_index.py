@@ -0,0 +1,81 @@
+import pytest
+
+from lib import symbol_index
+from lib.symbol_index import SymbolIndex, fold, get_symbol_index, load_symbols
+
+
+@pytest.fixture(scope="module")
+def index():
+    return get_symbol_index()
+
+
+def test_fold_turkish_characters():
+    assert fold("İŞ BANKASI") == fold("iş bankası") == fold("is  bankasi") == "is bankasi"
+
+
+@pytest.mark.parametrize("text, asset_type, expected", [
+    ("garan", "stock", "GARAN"),
+    ("GARAN.IS", "stock", "GARAN"),
+    ("btc-usd", "crypto", "BTC"),
+    ("Eth", "crypto", "ETH"),
+])
+def test_resolve(index, text, asset_type, expected):
+    assert index.resolve(text, asset_type).symbol == expected
+
+
+def test_resolve_does_not_map_usdt_pair_to_usd(index):
+    assert index.resolve("ETH-USDT", "crypto") is None
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("GARAN.IS", "GARAN"),
+    ("gar", "GARAN"),
+    ("BTC-USD", "BTC"),
+])
+def test_search_strips_suffix_like_resolve(index, query, expected):
+    assert expected in [info.symbol for info in index.search(query)]
+
+
+def test_search_prefix_by_name(index):
+    results = index.search("iş bank", asset_type="stock")
+    assert results and all(info.asset_type == "stock" for info in results)
+    assert "ISCTR" in [info.symbol for info in results]
+
+
+def test_search_fuzzy_single_typo(index):
+    assert index.search("garna")[0].symbol == "GARAN"
+
+
+def test_search_respects_limit(index):
+    assert len(index.search("a", limit=3)) == 3
+
+
+def test_empty_query(index):
+    assert index.search("   ") == []
+
+
+def test_index_from_custom_symbols():
+    symbols = [info for info in load_symbols() if info.symbol in ("GARAN", "BTC")]
+    index = SymbolIndex(symbols)
+    assert [info.symbol for info in index.search("g")] == ["GARAN"]
+    assert index.resolve("akbnk") is None
+
+
+def test_filtered_short_prefix_is_not_crowded_out(index):
+    # "t" önekinde hisseler genel TRIE_TOP_K listesini doldurur
+    assert "USDT" in [info.symbol for info in index.search("t", asset_type="crypto")]
+
+
+def test_filtered_search_with_small_top_k(monkeypatch):
+    monkeypatch.setattr(symbol_index, "TRIE_TOP_K", 3)
+    index = SymbolIndex(load_symbols())
+
+    for prefix in ("t", "a", "b", "s"):
+        matching = [
+            info.symbol for symbol_id, info in enumerate(index.symbols)
+            if info.asset_type == "crypto"
+            and any(key.startswith(prefix) for key in index._prefix_keys[symbol_id])
+        ]
+        actual = [info.symbol for info in index.search(prefix, limit=3, asset_type="crypto")]
+        assert len(actual) == min(3, len(matching))
+        assert set(actual) <= set(matching)
@@ -0,0 +1,20 @@
+/**
+ * TypeScript paritesi - golden vector fixture'ını lib/financial-analysis.ts ile doğrular
+ * Python tarafı tests/test_golden_vectors.py ile aynı fixture'a karşı test edilir.
+ *
+ * Kullanım (Stoxly dizininden):
+ *     npm test
+ */
+import { verifyGoldenVectors } from "../lib/parity";
+
+const mismatches = verifyGoldenVectors();
+
+if (mismatches.length > 0) {
+  console.error(`Golden vector uyuşmazlıkları (${mismatches.length}):`);
+  for (const mismatch of mismatches) {
+    console.error(`  ${mismatch}`);
+  }
+  process.exit(1);
+}
+
+console.log("Golden vector paritesi sağlandı.");
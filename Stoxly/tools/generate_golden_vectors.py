@@ -0,0 +1,76 @@
+"""
+Golden vector üreteci - Python/TypeScript parite fixture'ını yeniden oluşturur
+Beklenen değerler Python implementasyonundan (lib/financial_analysis.py) alınır;
+aynı dosya lib/parity.ts ve tools/check-parity.ts tarafından TypeScript'e karşı doğrulanır.
+
+Hesaplama mantığı bilinçli olarak değiştirildiğinde çalıştırılmalıdır.
+
+Kullanım (Stoxly dizininden):
+    python tools/generate_golden_vectors.py
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from typing import List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.snapshot import GOLDEN_VECTORS_PATH, golden_vector_case
+
+
+FORMAT_VERSION = 1
+
+
+def walk(n: int, start: float, drift: float, amplitude: float, step: float) -> List[float]:
+    """Trend + sinüs dalgası şeklinde deterministik fiyat serisi"""
+    return [
+        round(start * (1 + drift) ** i + amplitude * math.sin(i * step), 2)
+        for i in range(n)
+    ]
+
+
+def build_cases() -> List[dict]:
+    """Fixture'daki vakalar"""
+    closes = {
+        "short_series": [10.0, 10.5, 10.25, 11.0, 10.75],
+        "flat": [50.0] * 30,
+        "steady_rise": [round(20 + 0.35 * i, 2) for i in range(60)],
+        "steady_fall": [round(150 - 0.4 * i, 2) for i in range(220)],
+        "oscillating": walk(120, 100.0, 0.0, 6.0, 0.7),
+        "uptrend_noisy": walk(252, 35.0, 0.004, 1.5, 1.3),
+        "downtrend_noisy": walk(252, 42000.0, -0.003, 900.0, 0.9),
+        "volatile": [round(80 + (25 if i % 2 else -25) + 0.1 * i, 2) for i in range(40)],
+        # Tam yarım sınırı: sma20 ve fiyat 10.125 (ikilik tabanda tam gösterilir).
+        # Math.round 10.13 verir; Python'un round() fonksiyonu 10.12 verirdi
+        "half_tie_flat": [10.125] * 20,
+        "half_tie_mean": [10.0] * 19 + [12.5],
+        # Toplama hatası nedeniyle ortalama 2.67499... olur; iki tarafta da 2.67 kalmalı
+        "near_half_tie": [2.675] * 20,
+    }
+    return [golden_vector_case(name, values) for name, values in closes.items()]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Golden vector fixture'ını yeniden oluştur")
+    parser.add_argument("--output", default=GOLDEN_VECTORS_PATH, help="Çıktı dosyası")
+    args = parser.parse_args(argv)
+
+    fixture = {
+        "description": (
+            "Python (lib/financial_analysis.py) ve TypeScript (lib/financial-analysis.ts) "
+            "hesaplamaları için golden vector'ler"
+        ),
+        "formatVersion": FORMAT_VERSION,
+        "cases": build_cases(),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    print(f"{len(fixture['cases'])} vaka yazıldı: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Yük testi - Eşzamanlı kullanıcılar için analiz hattı kapasite ölçümü
+N kullanıcıyı thread olarak simüle eder; her kullanıcı tekli analizler ve
+toplu karşılaştırmalar karışımı çalıştırır:
+fetch_data -> calculate_all_indicators -> translate_indicators
+
+Veri, deterministik çevrimdışı bir sağlayıcıdan gelir (ağ erişimi yoktur).
+Throughput, p50/p95/p99 gecikme ve zaman içindeki bellek artışı raporlanır.
+
+Kullanım (Stoxly dizininden):
+    python tools/load_test.py --users 20 --duration 30
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from yfinance.exceptions import YFTickerMissingError
+
+from lib import mock_service
+from lib.mock_service import fetch_data
+from lib.financial_analysis import calculate_all_indicators
+from lib.text_translator import translate_indicators, get_risk_level
+from lib.symbol_index import get_symbol_index
+from lib.types import AssetType
+
+
+class OfflineProvider:
+    """
+    Deterministik çevrimdışı veri sağlayıcı
+    Her sembol için fiyat serisi sembol adından türetilen tohumla üretilir.
+    Sembol listesinde olmayan semboller için "bilinmeyen sembol" hatası verir.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, n_bars: int = 252):
+        self.latency = latency_ms / 1000
+        self.n_bars = n_bars
+        self.known = {info.yahoo_symbol for info in get_symbol_index().symbols}
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def _frame(self, symbol: str) -> pd.DataFrame:
+        """Sembol için fiyat tablosunu üret (bir kez)"""
+        with self._lock:
+            if symbol in self._frames:
+                return self._frames[symbol]
+
+        rng = np.random.default_rng(zlib.crc32(symbol.encode("utf-8")))
+        base_price = 30000.0 if symbol.endswith("-USD") else 50.0
+        closes = base_price * np.cumprod(1 + rng.normal(0.0005, 0.02, self.n_bars))
+        spread = closes * rng.uniform(0.0, 0.02, self.n_bars)
+        frame = pd.DataFrame(
+            {
+                "Open": closes + rng.uniform(-1, 1, self.n_bars) * spread,
+                "High": closes + spread,
+                "Low": closes - spread,
+                "Close": closes,
+                "Volume": rng.uniform(1e6, 1e7, self.n_bars).round(),
+            },
+            index=pd.bdate_range(end="2024-12-31", periods=self.n_bars, tz="Europe/Istanbul")
+        )
+
+        with self._lock:
+            return self._frames.setdefault(symbol, frame)
+
+    def __call__(self, symbol: str) -> "OfflineProvider._Ticker":
+        """mock_service.ticker_factory ile uyumlu arayüz"""
+        return OfflineProvider._Ticker(self, symbol)
+
+    class _Ticker:
+        def __init__(self, provider: "OfflineProvider", symbol: str):
+            self.provider = provider
+            self.symbol = symbol
+
+        def history(self, period: str = "1y", raise_errors: bool = False) -> pd.DataFrame:
+            if self.provider.latency:
+                time.sleep(self.provider.latency)
+            if self.symbol not in self.provider.known:
+                raise YFTickerMissingError(self.symbol, "offline provider")
+            return self.provider._frame(self.symbol)
+
+
+@dataclass
+class LoadTestConfig:
+    """Yük testi parametreleri"""
+    users: int = 10
+    duration: float = 30.0
+    batch_ratio: float = 0.2
+    batch_size: int = 3
+    invalid_ratio: float = 0.05
+    think_time_ms: float = 0.0
+    provider_latency_ms: float = 0.0
+    sample_interval: float = 1.0
+    seed: int = 0
+
+
+@dataclass
+class LoadTestResult:
+    """Yük testi sonuçları"""
+    config: LoadTestConfig
+    elapsed: float
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: int = 0
+    memory_samples: List[Tuple[float, float]] = field(default_factory=list)
+
+
+def current_rss_mb() -> float:
+    """Sürecin güncel bellek kullanımı (MB); /proc yoksa tepe değer kullanılır"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource  # Windows'ta bulunmaz; yalnızca /proc olmayan Unix'lerde gerekir
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS byte, Linux KB döndürür
+        return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def analyze(ticker: str, asset_type: AssetType) -> str:
+    """Tekli analiz - uygulamadaki "Analiz Et" akışı"""
+    price_data = fetch_data(ticker, asset_type)
+    indicators = calculate_all_indicators(price_data)
+    translate_indicators(indicators)
+    return get_risk_level(indicators.risk_score)
+
+
+def compare(tickers: List[Tuple[str, AssetType]]) -> List[str]:
+    """Toplu karşılaştırma - notebook'taki karşılaştırma döngüsü"""
+    return [analyze(ticker, asset_type) for ticker, asset_type in tickers]
+
+
+def _user_loop(
+    user_id: int,
+    config: LoadTestConfig,
+    universe: List[Tuple[str, AssetType]],
+    deadline: float,
+    result: LoadTestResult,
+    lock: threading.Lock
+) -> None:
+    """Tek bir kullanıcının istek döngüsü"""
+    rng = random.Random(config.seed * 100003 + user_id)
+    latencies: Dict[str, List[float]] = {"single": [], "batch": []}
+    errors = 0
+
+    def pick() -> Tuple[str, AssetType]:
+        if rng.random() < config.invalid_ratio:
+            # Yazım hatası: geçerli bir koda rastgele harf ekle
+            ticker, asset_type = rng.choice(universe)
+            return ticker + rng.choice("QWXZ"), asset_type
+        return rng.choice(universe)
+
+    while time.perf_counter() < deadline:
+        is_batch = rng.random() < config.batch_ratio
+        started = time.perf_counter()
+        try:
+            if is_batch:
+                compare([pick() for _ in range(config.batch_size)])
+            else:
+                analyze(*pick())
+        except Exception:
+            errors += 1
+        latencies["batch" if is_batch else "single"].append(time.perf_counter() - started)
+
+        if config.think_time_ms:
+            time.sleep(rng.expovariate(1000 / config.think_time_ms))
+
+    with lock:
+        for kind, values in latencies.items():
+            result.latencies.setdefault(kind, []).extend(values)
+        result.errors += errors
+
+
+def run_load_test(config: LoadTestConfig) -> LoadTestResult:
+    """Yük testini çalıştır"""
+    universe = [(info.symbol, info.asset_type) for info in get_symbol_index().symbols]
+    previous_factory = mock_service.ticker_factory
+    mock_service.ticker_factory = OfflineProvider(config.provider_latency_ms)
+    mock_service.clear_caches()
+
+    result = LoadTestResult(config=config, elapsed=0.0)
+    lock = threading.Lock()
+    stop = threading.Event()
+    started = time.perf_counter()
+    deadline = started + config.duration
+
+    def sample_memory() -> None:
+        while True:
+            result.memory_samples.append((time.perf_counter() - started, current_rss_mb()))
+            if stop.wait(config.sample_interval):
+                break
+
+    monitor = threading.Thread(target=sample_memory, daemon=True)
+    users = [
+        threading.Thread(
+            target=_user_loop,
+            args=(user_id, config, universe, deadline, result, lock),
+            daemon=True
+        )
+        for user_id in range(config.users)
+    ]
+    try:
+        monitor.start()
+        for user in users:
+            user.start()
+    finally:
+        # Başlatma yarıda kalsa bile başlayan thread'ler beklenir ve sağlayıcı geri yüklenir
+        for user in users:
+            if user.is_alive():
+                user.join()
+        result.elapsed = time.perf_counter() - started
+        stop.set()
+        if monitor.is_alive():
+            monitor.join()
+        mock_service.ticker_factory = previous_factory
+        mock_service.clear_caches()
+
+    result.memory_samples.append((result.elapsed, current_rss_mb()))
+    return result
+
+
+def summarize(result: LoadTestResult) -> dict:
+    """Sonuçları özetle: throughput, gecikme yüzdelikleri ve bellek artışı"""
+    summary = {
+        "users": result.config.users,
+        "elapsed_s": round(result.elapsed, 3),
+        "errors": result.errors,
+        "requests": {},
+    }
+
+    all_latencies = []
+    for kind, values in sorted(result.latencies.items()):
+        all_latencies.extend(values)
+        summary["requests"][kind] = _latency_stats(values, result.elapsed)
+    summary["requests"]["total"] = _latency_stats(all_latencies, result.elapsed)
+
+    memory = result.memory_samples
+    summary["memory_mb"] = {
+        "start": round(memory[0][1], 1),
+        "end": round(memory[-1][1], 1),
+        "peak": round(max(rss for _, rss in memory), 1),
+        "growth": round(memory[-1][1] - memory[0][1], 1),
+        "samples": [(round(t, 2), round(rss, 1)) for t, rss in memory],
+    }
+    return summary
+
+
+def _latency_stats(values: List[float], elapsed: float) -> dict:
+    """Tek bir istek tipi için istatistikler (gecikmeler ms)"""
+    if not values:
+        return {"count": 0, "throughput_rps": 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+    return {
+        "count": len(values),
+        "throughput_rps": round(len(values) / elapsed, 2),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(max(values) * 1000, 3),
+    }
+
+
+def format_report(summary: dict) -> str:
+    """Özeti okunabilir metne çevir"""
+    lines = [
+        f"Kullanıcı: {summary['users']}  Süre: {summary['elapsed_s']} s  Hata: {summary['errors']}",
+        "",
+        f"{'Tip':<8}{'Adet':>9}{'İstek/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+    ]
+    for kind, stats in summary["requests"].items():
+        if not stats["count"]:
+            continue
+        lines.append(
+            f"{kind:<8}{stats['count']:>9}{stats['throughput_rps']:>11.2f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+
+    memory = summary["memory_mb"]
+    lines += [
+        "",
+        f"Bellek (MB): başlangıç {memory['start']}, bitiş {memory['end']}, "
+        f"tepe {memory['peak']}, artış {memory['growth']:+}",
+        "Zaman (s) -> RSS (MB): " + ", ".join(f"{t}:{rss}" for t, rss in memory["samples"]),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stoxly analiz hattı yük testi")
+    parser.add_argument("--users", type=int, default=10, help="Eşzamanlı kullanıcı sayısı")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test süresi (saniye)")
+    parser.add_argument("--batch-ratio", type=float, default=0.2, help="Toplu karşılaştırma oranı")
+    parser.add_argument("--batch-size", type=int, default=3, help="Karşılaştırmadaki sembol sayısı")
+    parser.add_argument("--invalid-ratio", type=float, default=0.05, help="Hatalı sembol oranı")
+    parser.add_argument("--think-time-ms", type=float, default=0.0, help="İstekler arası ortalama bekleme")
+    parser.add_argument("--provider-latency-ms", type=float, default=0.0, help="Simüle ağ gecikmesi")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Bellek örnekleme aralığı (s)")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--json", help="Özeti JSON olarak bu dosyaya yaz")
+    args = parser.parse_args(argv)
+
+    # Hatalı sembol uyarıları rapor çıktısını kalabalıklaştırmasın
+    logging.getLogger(mock_service.__name__).setLevel(logging.ERROR)
+
+    config = LoadTestConfig(
+        users=args.users,
+        duration=args.duration,
+        batch_ratio=args.batch_ratio,
+        batch_size=args.batch_size,
+        invalid_ratio=args.invalid_ratio,
+        think_time_ms=args.think_time_ms,
+        provider_latency_ms=args.provider_latency_ms,
+        sample_interval=args.sample_interval,
+        seed=args.seed
+    )
+    summary = summarize(run_load_test(config))
+    print(format_report(summary))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()